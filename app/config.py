@@ -1,9 +1,17 @@
 """Configuration management for the Loki MCP server."""
 
 import os
+import re
+import sys
 from dataclasses import dataclass
-from typing import Optional
-from urllib.parse import urlparse
+from typing import Optional, Tuple
+
+# Scheme and network location of an absolute URL; compiled once instead of
+# running urlparse on every LokiConfig construction.
+_URL_RE = re.compile(r'^([A-Za-z][A-Za-z0-9+.-]*)://([^/?#\s]+)')
+
+# dataclass(slots=True) is only available from Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
 
 class ConfigurationError(Exception):
@@ -11,9 +19,16 @@ class ConfigurationError(Exception):
     pass
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class LokiConfig:
-    """Configuration for Loki MCP server."""
+    """Configuration for Loki MCP server.
+    
+    Set ``trust_arguments`` only when every tool caller is trusted: tool
+    arguments are then used as given, without Pydantic validation, for
+    parameter models with only unconstrained scalar fields and no
+    validators, and only when each value already has its field's type.
+    Other tools and arguments are still validated.
+    """
     url: str
     username: Optional[str] = None
     password: Optional[str] = None
@@ -22,6 +37,7 @@ class LokiConfig:
     max_retries: int = 3
     rate_limit_requests: int = 100
     rate_limit_period: int = 60
+    trust_arguments: bool = False
 
     def __post_init__(self):
         """Validate configuration after initialization."""
@@ -29,75 +45,115 @@ class LokiConfig:
 
     def _validate(self):
         """Validate configuration values."""
+        url = self.url
+        username = self.username
+        password = self.password
+        timeout = self.timeout
+        max_retries = self.max_retries
+        rate_limit_requests = self.rate_limit_requests
+        rate_limit_period = self.rate_limit_period
+
         # Validate URL
-        if not self.url:
+        if not url:
             raise ConfigurationError("Loki URL is required")
         
-        parsed_url = urlparse(self.url)
-        if not parsed_url.scheme or not parsed_url.netloc:
-            raise ConfigurationError(f"Invalid Loki URL format: {self.url}")
+        match = _URL_RE.match(url)
+        if not match:
+            raise ConfigurationError(f"Invalid Loki URL format: {url}")
         
-        if parsed_url.scheme not in ['http', 'https']:
-            raise ConfigurationError(f"Loki URL must use http or https protocol: {self.url}")
+        if match.group(1).lower() not in ('http', 'https'):
+            raise ConfigurationError(f"Loki URL must use http or https protocol: {url}")
 
         # Validate authentication
-        if self.username and not self.password:
+        if username and not password:
             raise ConfigurationError("Password is required when username is provided")
         
-        if self.password and not self.username:
+        if password and not username:
             raise ConfigurationError("Username is required when password is provided")
 
-        if self.username and self.bearer_token:
+        if username and self.bearer_token:
             raise ConfigurationError("Cannot use both basic auth (username/password) and bearer token")
 
-        # Validate numeric values
-        if self.timeout <= 0:
-            raise ConfigurationError(f"Timeout must be positive: {self.timeout}")
+        # Validate numeric values; only work out which one is wrong on failure
+        if min(timeout, rate_limit_requests, rate_limit_period) > 0 and max_retries >= 0:
+            return
+
+        if timeout <= 0:
+            raise ConfigurationError(f"Timeout must be positive: {timeout}")
         
-        if self.max_retries < 0:
-            raise ConfigurationError(f"Max retries cannot be negative: {self.max_retries}")
+        if max_retries < 0:
+            raise ConfigurationError(f"Max retries cannot be negative: {max_retries}")
         
-        if self.rate_limit_requests <= 0:
-            raise ConfigurationError(f"Rate limit requests must be positive: {self.rate_limit_requests}")
+        if rate_limit_requests <= 0:
+            raise ConfigurationError(f"Rate limit requests must be positive: {rate_limit_requests}")
         
-        if self.rate_limit_period <= 0:
-            raise ConfigurationError(f"Rate limit period must be positive: {self.rate_limit_period}")
+        raise ConfigurationError(f"Rate limit period must be positive: {rate_limit_period}")
 
 
-def load_config() -> LokiConfig:
-    """Load configuration from environment variables with defaults."""
-    try:
-        # Required configuration
-        url = os.getenv('LOKI_URL')
-        if not url:
-            raise ConfigurationError(
-                "LOKI_URL environment variable is required. "
-                "Please set it to your Loki server URL (e.g., http://localhost:3100)"
-            )
-
-        # Optional authentication
-        username = os.getenv('LOKI_USERNAME')
-        password = os.getenv('LOKI_PASSWORD')
-        bearer_token = os.getenv('LOKI_BEARER_TOKEN')
-
-        # Optional configuration with defaults
-        timeout = int(os.getenv('LOKI_TIMEOUT', '30'))
-        max_retries = int(os.getenv('LOKI_MAX_RETRIES', '3'))
-        rate_limit_requests = int(os.getenv('LOKI_RATE_LIMIT_REQUESTS', '100'))
-        rate_limit_period = int(os.getenv('LOKI_RATE_LIMIT_PERIOD', '60'))
-
-        return LokiConfig(
-            url=url,
-            username=username,
-            password=password,
-            bearer_token=bearer_token,
-            timeout=timeout,
-            max_retries=max_retries,
-            rate_limit_requests=rate_limit_requests,
-            rate_limit_period=rate_limit_period
+# Environment variables read by load_config and their defaults, in the order
+# _calculate_config expects. The trailing entries are the integer settings.
+_ENV_VARS = (
+    ('LOKI_URL', None),
+    ('LOKI_USERNAME', None),
+    ('LOKI_PASSWORD', None),
+    ('LOKI_BEARER_TOKEN', None),
+    ('LOKI_TIMEOUT', '30'),
+    ('LOKI_MAX_RETRIES', '3'),
+    ('LOKI_RATE_LIMIT_REQUESTS', '100'),
+    ('LOKI_RATE_LIMIT_PERIOD', '60'),
+)
+
+# Last loaded configuration, keyed by the raw environment values it was built from.
+_cache: Optional[Tuple[Tuple[Optional[str], ...], LokiConfig]] = None
+
+
+def _calculate_config(env: Tuple[Optional[str], ...]) -> LokiConfig:
+    """Build configuration from raw environment values."""
+    url, username, password, bearer_token = env[:4]
+
+    # Required configuration
+    if not url:
+        raise ConfigurationError(
+            "LOKI_URL environment variable is required. "
+            "Please set it to your Loki server URL (e.g., http://localhost:3100)"
         )
-    
+
+    try:
+        timeout, max_retries, rate_limit_requests, rate_limit_period = map(int, env[4:])
     except ValueError as e:
         raise ConfigurationError(f"Invalid numeric configuration value: {e}")
-    except Exception as e:
-        raise ConfigurationError(f"Failed to load configuration: {e}")
\ No newline at end of file
+
+    return LokiConfig(
+        url=url,
+        username=username,
+        password=password,
+        bearer_token=bearer_token,
+        timeout=timeout,
+        max_retries=max_retries,
+        rate_limit_requests=rate_limit_requests,
+        rate_limit_period=rate_limit_period
+    )
+
+
+def load_config(reset_cache: bool = False) -> LokiConfig:
+    """
+    Load configuration from environment variables with defaults.
+    
+    The parsed configuration is cached and returned as-is until one of the
+    LOKI_* environment variables changes.
+    
+    Args:
+        reset_cache: Discard any cached configuration and rebuild it
+        
+    Returns:
+        Loki configuration
+    """
+    global _cache
+    
+    env = tuple(os.environ.get(name, default) for name, default in _ENV_VARS)
+    if not reset_cache and _cache is not None and _cache[0] == env:
+        return _cache[1]
+    
+    config = _calculate_config(env)
+    _cache = (env, config)
+    return config
@@ -2,40 +2,76 @@
 
 from typing import Any, Dict, List, Optional, Union
 
-import structlog
-
 from .config import LokiConfig
 from .loki_client import LokiClient
-from .error_handler import ErrorHandler, ErrorContext
+from .error_handler import DIRECT_FALLBACK, ErrorHandler, ErrorContext
+
+# Operation names reported in ErrorContext and error statistics
+_OP_QUERY_RANGE = "query_range"
+_OP_QUERY_INSTANT = "query_instant"
+_OP_LABEL_NAMES = "label_names"
+_OP_LABEL_VALUES = "label_values"
+_OP_SERIES = "series"
 
-logger = structlog.get_logger(__name__)
+# Parameter names recorded in ErrorContext, in call-argument order
+_QUERY_RANGE_KEYS = ("query", "start", "end", "limit", "direction", "step")
+_QUERY_INSTANT_KEYS = ("query", "time", "limit", "direction")
+_LABEL_NAMES_KEYS = ("start", "end")
+_LABEL_VALUES_KEYS = ("label", "start", "end")
+_SERIES_KEYS = ("match", "start", "end")
 
 
 class EnhancedLokiClient:
     """Loki client with enhanced error handling and retry logic."""
     
-    def __init__(self, config: LokiConfig):
+    def __init__(self, config: LokiConfig, client: Optional[LokiClient] = None):
         """
         Initialize enhanced Loki client.
         
         Args:
             config: Loki configuration
+            client: Optional shared LokiClient. A shared client is left open
+                on exit so its connection pool can be reused.
         """
         self.config = config
-        self._client = LokiClient(config)
+        self._owns_client = client is None
+        self._client = client if client is not None else LokiClient(config)
+        # Rate-limit deadlines live on the LokiClient, so tool calls sharing
+        # a client coalesce their 429 waits
         self._error_handler = ErrorHandler(
             max_retries=config.max_retries,
-            enable_circuit_breaker=True
+            enable_circuit_breaker=True,
+            rate_limit_deadlines=self._client.rate_limit_deadlines
         )
+        # Resolved once; config is immutable
+        self._max_attempts = config.max_retries + 1
+        self._loki_url = config.url
+        # Bound methods resolved once rather than on every call. With retries
+        # disabled the single-attempt path avoids the retry loop entirely.
+        self._use_retry = config.max_retries > 0
+        self._handle = (
+            self._error_handler.handle_with_retry
+            if self._use_retry
+            else self._error_handler.handle_once
+        )
+        self._try_direct = self._error_handler.try_direct
+        self._c_query_range = self._client.query_range
+        self._c_query_instant = self._client.query_instant
+        self._c_label_names = self._client.label_names
+        self._c_label_values = self._client.label_values
+        self._c_series = self._client.series
     
     async def __aenter__(self):
         """Async context manager entry."""
-        await self._client.__aenter__()
+        # A shared client opens its session on first request
+        if self._owns_client:
+            await self._client.__aenter__()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        await self._client.__aexit__(exc_type, exc_val, exc_tb)
+        if self._owns_client:
+            await self._client.__aexit__(exc_type, exc_val, exc_tb)
     
     async def query_range(
         self,
@@ -47,22 +83,28 @@ class EnhancedLokiClient:
         step: Optional[str] = None
     ) -> Dict[str, Any]:
         """Execute a range query against Loki with error handling."""
+        result = await self._try_direct(
+            self._c_query_range,
+            _OP_QUERY_RANGE,
+            query,
+            start,
+            end,
+            limit,
+            direction,
+            step
+        )
+        if result is not DIRECT_FALLBACK:
+            return result
+        
         context = ErrorContext(
-            operation="query_range",
-            parameters={
-                "query": query,
-                "start": start,
-                "end": end,
-                "limit": limit,
-                "direction": direction,
-                "step": step
-            },
-            max_attempts=self.config.max_retries + 1,
-            loki_url=self.config.url
+            _OP_QUERY_RANGE,
+            dict(zip(_QUERY_RANGE_KEYS, (query, start, end, limit, direction, step))),
+            max_attempts=self._max_attempts,
+            loki_url=self._loki_url
         )
         
-        return await self._error_handler.handle_with_retry(
-            self._client.query_range,
+        return await self._handle(
+            self._c_query_range,
             context,
             query,
             start,
@@ -80,20 +122,26 @@ class EnhancedLokiClient:
         direction: str = "backward"
     ) -> Dict[str, Any]:
         """Execute an instant query against Loki with error handling."""
+        result = await self._try_direct(
+            self._c_query_instant,
+            _OP_QUERY_INSTANT,
+            query,
+            time,
+            limit,
+            direction
+        )
+        if result is not DIRECT_FALLBACK:
+            return result
+        
         context = ErrorContext(
-            operation="query_instant",
-            parameters={
-                "query": query,
-                "time": time,
-                "limit": limit,
-                "direction": direction
-            },
-            max_attempts=self.config.max_retries + 1,
-            loki_url=self.config.url
+            _OP_QUERY_INSTANT,
+            dict(zip(_QUERY_INSTANT_KEYS, (query, time, limit, direction))),
+            max_attempts=self._max_attempts,
+            loki_url=self._loki_url
         )
         
-        return await self._error_handler.handle_with_retry(
-            self._client.query_instant,
+        return await self._handle(
+            self._c_query_instant,
             context,
             query,
             time,
@@ -107,15 +155,24 @@ class EnhancedLokiClient:
         end: Optional[str] = None
     ) -> List[str]:
         """Get list of label names with error handling."""
+        result = await self._try_direct(
+            self._c_label_names,
+            _OP_LABEL_NAMES,
+            start,
+            end
+        )
+        if result is not DIRECT_FALLBACK:
+            return result
+        
         context = ErrorContext(
-            operation="label_names",
-            parameters={"start": start, "end": end},
-            max_attempts=self.config.max_retries + 1,
-            loki_url=self.config.url
+            _OP_LABEL_NAMES,
+            dict(zip(_LABEL_NAMES_KEYS, (start, end))),
+            max_attempts=self._max_attempts,
+            loki_url=self._loki_url
         )
         
-        return await self._error_handler.handle_with_retry(
-            self._client.label_names,
+        return await self._handle(
+            self._c_label_names,
             context,
             start,
             end
@@ -128,15 +185,25 @@ class EnhancedLokiClient:
         end: Optional[str] = None
     ) -> List[str]:
         """Get list of label values for a specific label with error handling."""
+        result = await self._try_direct(
+            self._c_label_values,
+            _OP_LABEL_VALUES,
+            label,
+            start,
+            end
+        )
+        if result is not DIRECT_FALLBACK:
+            return result
+        
         context = ErrorContext(
-            operation="label_values",
-            parameters={"label": label, "start": start, "end": end},
-            max_attempts=self.config.max_retries + 1,
-            loki_url=self.config.url
+            _OP_LABEL_VALUES,
+            dict(zip(_LABEL_VALUES_KEYS, (label, start, end))),
+            max_attempts=self._max_attempts,
+            loki_url=self._loki_url
         )
         
-        return await self._error_handler.handle_with_retry(
-            self._client.label_values,
+        return await self._handle(
+            self._c_label_values,
             context,
             label,
             start,
@@ -150,15 +217,28 @@ class EnhancedLokiClient:
         end: Optional[str] = None
     ) -> List[Dict[str, str]]:
         """Get list of time series that match label selectors with error handling."""
+        # Normalise once so retries reuse the same hashable selector tuple
+        match = (match,) if isinstance(match, str) else tuple(match)
+        
+        result = await self._try_direct(
+            self._c_series,
+            _OP_SERIES,
+            match,
+            start,
+            end
+        )
+        if result is not DIRECT_FALLBACK:
+            return result
+        
         context = ErrorContext(
-            operation="series",
-            parameters={"match": match, "start": start, "end": end},
-            max_attempts=self.config.max_retries + 1,
-            loki_url=self.config.url
+            _OP_SERIES,
+            dict(zip(_SERIES_KEYS, (match, start, end))),
+            max_attempts=self._max_attempts,
+            loki_url=self._loki_url
         )
         
-        return await self._error_handler.handle_with_retry(
-            self._client.series,
+        return await self._handle(
+            self._c_series,
             context,
             match,
             start,
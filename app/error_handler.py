@@ -1,15 +1,23 @@
 """Comprehensive error handling for the Loki MCP server."""
 
 import asyncio
+import logging
+import random
+import sys
 import time
-from enum import Enum
-from typing import Any, Dict, List, Optional, Type, Union
+from collections import defaultdict
+from enum import Enum, IntEnum
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
 from urllib.parse import urlparse
 
 import structlog
 import httpx
+from pydantic import ValidationError
 
+from .config import ConfigurationError
 from .loki_client import (
     LokiClientError, 
     LokiConnectionError, 
@@ -20,7 +28,29 @@ from .loki_client import (
 
 logger = structlog.get_logger(__name__)
 
-logger = structlog.get_logger(__name__)
+# Underlying stdlib logger; its level decides whether structlog emits
+# anything, so it is checked before building per-attempt debug events.
+_std_logger = logging.getLogger(__name__)
+
+# Clock for durations and circuit breaker timing. Monotonic, so recovery
+# timeouts are not affected by wall-clock adjustments.
+_now = time.monotonic
+
+# Jitter source for retry backoff: a dedicated generator, so jitter does not
+# share state with other users of the random module, with uniform bound once
+_JITTER_RNG = random.Random()
+_uniform = _JITTER_RNG.uniform
+
+# dataclass(slots=True) is only available from Python 3.10
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Returned by ErrorHandler.try_direct when the caller must use handle_with_retry
+DIRECT_FALLBACK = object()
+
+# Message and suggestion for parameter validation errors, shared with the
+# server's fast path for pydantic ValidationError
+VALIDATION_ERROR_MESSAGE = "Parameter validation failed"
+VALIDATION_ERROR_SUGGESTION = "Check parameter types and values"
 
 
 class ErrorCategory(Enum):
@@ -35,6 +65,10 @@ class ErrorCategory(Enum):
     UNKNOWN = "unknown"
 
 
+# ErrorCategory values looked up by member; cheaper than the Enum.value property
+_CATEGORY_KEYS = {category: category.value for category in ErrorCategory}
+
+
 class ErrorSeverity(Enum):
     """Severity levels for errors."""
     LOW = "low"
@@ -43,7 +77,7 @@ class ErrorSeverity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ErrorContext:
     """Context information for error handling."""
     operation: str
@@ -54,7 +88,7 @@ class ErrorContext:
     loki_url: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ErrorInfo:
     """Structured error information."""
     category: ErrorCategory
@@ -67,6 +101,230 @@ class ErrorInfo:
     user_actionable: bool = True
 
 
+def _classify_authentication(error: Exception) -> ErrorInfo:
+    return ErrorInfo(
+        category=ErrorCategory.AUTHENTICATION,
+        severity=ErrorSeverity.HIGH,
+        message="Authentication failed",
+        suggestion="Check your Loki credentials (username/password or bearer token)",
+        details=str(error),
+        should_retry=False,
+        user_actionable=True
+    )
+
+
+def _classify_rate_limit(error: Exception) -> ErrorInfo:
+    return ErrorInfo(
+        category=ErrorCategory.RATE_LIMIT,
+        severity=ErrorSeverity.MEDIUM,
+        message="Rate limit exceeded",
+        suggestion="Reduce request frequency or wait before retrying",
+        details=str(error),
+        retry_after=60,  # Default retry after 1 minute
+        should_retry=True,
+        user_actionable=True
+    )
+
+
+def _classify_query(error: Exception) -> ErrorInfo:
+    return ErrorInfo(
+        category=ErrorCategory.QUERY,
+        severity=ErrorSeverity.MEDIUM,
+        message="Query execution failed",
+        suggestion="Check your LogQL syntax and query parameters",
+        details=str(error),
+        should_retry=False,
+        user_actionable=True
+    )
+
+
+def _classify_connection(error: Exception) -> ErrorInfo:
+    return ErrorInfo(
+        category=ErrorCategory.CONNECTION,
+        severity=ErrorSeverity.HIGH,
+        message="Failed to connect to Loki",
+        suggestion="Check Loki URL and network connectivity",
+        details=str(error),
+        should_retry=True,
+        user_actionable=True
+    )
+
+
+def _classify_timeout(error: Exception) -> ErrorInfo:
+    return ErrorInfo(
+        category=ErrorCategory.TIMEOUT,
+        severity=ErrorSeverity.MEDIUM,
+        message="Request timed out",
+        suggestion="Check network connectivity or increase timeout setting",
+        details=f"Request timed out after {getattr(error, 'timeout', 'unknown')} seconds",
+        should_retry=True,
+        user_actionable=True
+    )
+
+
+def _classify_connect(error: Exception) -> ErrorInfo:
+    return ErrorInfo(
+        category=ErrorCategory.CONNECTION,
+        severity=ErrorSeverity.HIGH,
+        message="Connection failed",
+        suggestion="Verify Loki server is running and URL is correct",
+        details=str(error),
+        should_retry=True,
+        user_actionable=True
+    )
+
+
+def _classify_status_401(error: httpx.HTTPStatusError, details: str) -> ErrorInfo:
+    return ErrorInfo(
+        category=ErrorCategory.AUTHENTICATION,
+        severity=ErrorSeverity.HIGH,
+        message="Authentication required",
+        suggestion="Provide valid credentials for Loki access",
+        details=details,
+        should_retry=False,
+        user_actionable=True
+    )
+
+
+def _classify_status_403(error: httpx.HTTPStatusError, details: str) -> ErrorInfo:
+    return ErrorInfo(
+        category=ErrorCategory.AUTHENTICATION,
+        severity=ErrorSeverity.HIGH,
+        message="Access forbidden",
+        suggestion="Check user permissions for Loki access",
+        details=details,
+        should_retry=False,
+        user_actionable=True
+    )
+
+
+def _classify_status_429(error: httpx.HTTPStatusError, details: str) -> ErrorInfo:
+    return ErrorInfo(
+        category=ErrorCategory.RATE_LIMIT,
+        severity=ErrorSeverity.MEDIUM,
+        message="Too many requests",
+        suggestion="Wait before making more requests",
+        details=details,
+        retry_after=ErrorClassifier._extract_retry_after(error.response),
+        should_retry=True,
+        user_actionable=True
+    )
+
+
+def _classify_server_error(error: httpx.HTTPStatusError, details: str) -> ErrorInfo:
+    return ErrorInfo(
+        category=ErrorCategory.CONNECTION,
+        severity=ErrorSeverity.HIGH,
+        message="Server error",
+        suggestion="Loki server is experiencing issues, try again later",
+        details=details,
+        should_retry=True,
+        user_actionable=False
+    )
+
+
+def _classify_other_status(error: httpx.HTTPStatusError, details: str) -> ErrorInfo:
+    status_code = error.response.status_code
+    return ErrorInfo(
+        category=ErrorCategory.QUERY,
+        severity=ErrorSeverity.MEDIUM,
+        message=f"HTTP error {status_code}",
+        suggestion="Check request parameters and try again",
+        details=details,
+        should_retry=False,
+        user_actionable=True
+    )
+
+
+# Longest slice of an error response body kept in ErrorInfo.details
+_MAX_DETAIL_BYTES = 512
+
+# Specific HTTP status codes with their own classification
+_STATUS_HANDLERS = {
+    401: _classify_status_401,
+    403: _classify_status_403,
+    429: _classify_status_429,
+}
+
+# Fallback classification by status class (status_code // 100); anything
+# not listed is a generic HTTP error
+_STATUS_CLASS_HANDLERS = {
+    5: _classify_server_error,
+}
+
+
+def _response_excerpt(response: httpx.Response) -> str:
+    """Decode at most _MAX_DETAIL_BYTES of a response body for error details."""
+    content = response.content
+    excerpt = content[:_MAX_DETAIL_BYTES].decode(response.encoding or "utf-8", "replace")
+    if len(content) > _MAX_DETAIL_BYTES:
+        excerpt += "..."
+    return excerpt
+
+
+def _classify_http_status(error: httpx.HTTPStatusError) -> ErrorInfo:
+    """Classify an HTTP status error by its response status code."""
+    status_code = error.response.status_code
+    details = f"HTTP {status_code}: {_response_excerpt(error.response)}"
+    
+    handler = (
+        _STATUS_HANDLERS.get(status_code)
+        or _STATUS_CLASS_HANDLERS.get(status_code // 100, _classify_other_status)
+    )
+    return handler(error, details)
+
+
+def _classify_validation(error: Exception) -> ErrorInfo:
+    return ErrorInfo(
+        category=ErrorCategory.VALIDATION,
+        severity=ErrorSeverity.MEDIUM,
+        message=VALIDATION_ERROR_MESSAGE,
+        suggestion=VALIDATION_ERROR_SUGGESTION,
+        details=str(error),
+        should_retry=False,
+        user_actionable=True
+    )
+
+
+def _classify_configuration(error: Exception) -> ErrorInfo:
+    return ErrorInfo(
+        category=ErrorCategory.CONFIGURATION,
+        severity=ErrorSeverity.CRITICAL,
+        message="Configuration error",
+        suggestion="Check environment variables and configuration settings",
+        details=str(error),
+        should_retry=False,
+        user_actionable=True
+    )
+
+
+def _classify_unknown(error: Exception) -> ErrorInfo:
+    return ErrorInfo(
+        category=ErrorCategory.UNKNOWN,
+        severity=ErrorSeverity.MEDIUM,
+        message="Unexpected error occurred",
+        suggestion="Check logs for more details and try again",
+        details=str(error),
+        should_retry=True,
+        user_actionable=False
+    )
+
+
+# Classification by exception type, resolved along the error's MRO so
+# subclasses are handled like their registered base.
+_HANDLERS: Dict[type, Callable[[Exception], ErrorInfo]] = {
+    LokiAuthenticationError: _classify_authentication,
+    LokiRateLimitError: _classify_rate_limit,
+    LokiQueryError: _classify_query,
+    LokiConnectionError: _classify_connection,
+    httpx.TimeoutException: _classify_timeout,
+    httpx.ConnectError: _classify_connect,
+    httpx.HTTPStatusError: _classify_http_status,
+    ValidationError: _classify_validation,
+    ConfigurationError: _classify_configuration,
+}
+
+
 class ErrorClassifier:
     """Classifies errors and provides structured error information."""
     
@@ -85,164 +343,55 @@ class ErrorClassifier:
         Returns:
             Structured error information
         """
-        # Handle Loki-specific errors
-        if isinstance(error, LokiAuthenticationError):
-            return ErrorInfo(
-                category=ErrorCategory.AUTHENTICATION,
-                severity=ErrorSeverity.HIGH,
-                message="Authentication failed",
-                suggestion="Check your Loki credentials (username/password or bearer token)",
-                details=str(error),
-                should_retry=False,
-                user_actionable=True
-            )
+        error_type = type(error)
         
-        elif isinstance(error, LokiRateLimitError):
-            return ErrorInfo(
-                category=ErrorCategory.RATE_LIMIT,
-                severity=ErrorSeverity.MEDIUM,
-                message="Rate limit exceeded",
-                suggestion="Reduce request frequency or wait before retrying",
-                details=str(error),
-                retry_after=60,  # Default retry after 1 minute
-                should_retry=True,
-                user_actionable=True
-            )
-        
-        elif isinstance(error, LokiQueryError):
-            return ErrorInfo(
-                category=ErrorCategory.QUERY,
-                severity=ErrorSeverity.MEDIUM,
-                message="Query execution failed",
-                suggestion="Check your LogQL syntax and query parameters",
-                details=str(error),
-                should_retry=False,
-                user_actionable=True
-            )
+        # Most errors are exactly one of the registered types
+        handler = _HANDLERS.get(error_type)
+        if handler is not None:
+            return handler(error)
         
-        elif isinstance(error, LokiConnectionError):
-            return ErrorInfo(
-                category=ErrorCategory.CONNECTION,
-                severity=ErrorSeverity.HIGH,
-                message="Failed to connect to Loki",
-                suggestion="Check Loki URL and network connectivity",
-                details=str(error),
-                should_retry=True,
-                user_actionable=True
-            )
+        for cls in error_type.__mro__[1:]:
+            handler = _HANDLERS.get(cls)
+            if handler is not None:
+                return handler(error)
         
-        # Handle HTTP-specific errors
-        elif isinstance(error, httpx.TimeoutException):
-            return ErrorInfo(
-                category=ErrorCategory.TIMEOUT,
-                severity=ErrorSeverity.MEDIUM,
-                message="Request timed out",
-                suggestion="Check network connectivity or increase timeout setting",
-                details=f"Request timed out after {getattr(error, 'timeout', 'unknown')} seconds",
-                should_retry=True,
-                user_actionable=True
-            )
+        # Validation and configuration errors from other libraries are only
+        # recognisable by name
+        class_name = error.__class__.__name__
+        if 'ValidationError' in class_name:
+            return _classify_validation(error)
+        if 'ConfigurationError' in class_name:
+            return _classify_configuration(error)
         
-        elif isinstance(error, httpx.ConnectError):
-            return ErrorInfo(
-                category=ErrorCategory.CONNECTION,
-                severity=ErrorSeverity.HIGH,
-                message="Connection failed",
-                suggestion="Verify Loki server is running and URL is correct",
-                details=str(error),
-                should_retry=True,
-                user_actionable=True
-            )
-        
-        elif isinstance(error, httpx.HTTPStatusError):
-            status_code = error.response.status_code
-            if status_code == 401:
-                return ErrorInfo(
-                    category=ErrorCategory.AUTHENTICATION,
-                    severity=ErrorSeverity.HIGH,
-                    message="Authentication required",
-                    suggestion="Provide valid credentials for Loki access",
-                    details=f"HTTP {status_code}: {error.response.text}",
-                    should_retry=False,
-                    user_actionable=True
-                )
-            elif status_code == 403:
-                return ErrorInfo(
-                    category=ErrorCategory.AUTHENTICATION,
-                    severity=ErrorSeverity.HIGH,
-                    message="Access forbidden",
-                    suggestion="Check user permissions for Loki access",
-                    details=f"HTTP {status_code}: {error.response.text}",
-                    should_retry=False,
-                    user_actionable=True
-                )
-            elif status_code == 429:
-                return ErrorInfo(
-                    category=ErrorCategory.RATE_LIMIT,
-                    severity=ErrorSeverity.MEDIUM,
-                    message="Too many requests",
-                    suggestion="Wait before making more requests",
-                    details=f"HTTP {status_code}: {error.response.text}",
-                    retry_after=ErrorClassifier._extract_retry_after(error.response),
-                    should_retry=True,
-                    user_actionable=True
-                )
-            elif 500 <= status_code < 600:
-                return ErrorInfo(
-                    category=ErrorCategory.CONNECTION,
-                    severity=ErrorSeverity.HIGH,
-                    message="Server error",
-                    suggestion="Loki server is experiencing issues, try again later",
-                    details=f"HTTP {status_code}: {error.response.text}",
-                    should_retry=True,
-                    user_actionable=False
-                )
-            else:
-                return ErrorInfo(
-                    category=ErrorCategory.QUERY,
-                    severity=ErrorSeverity.MEDIUM,
-                    message=f"HTTP error {status_code}",
-                    suggestion="Check request parameters and try again",
-                    details=f"HTTP {status_code}: {error.response.text}",
-                    should_retry=False,
-                    user_actionable=True
-                )
+        return _classify_unknown(error)
+    
+    @staticmethod
+    def classify_error_fast(
+        error: Exception
+    ) -> Tuple[ErrorCategory, str, bool, Optional[int]]:
+        """
+        Classify an error for the retry decision only.
         
-        # Handle validation errors
-        elif hasattr(error, '__class__') and 'ValidationError' in error.__class__.__name__:
-            return ErrorInfo(
-                category=ErrorCategory.VALIDATION,
-                severity=ErrorSeverity.MEDIUM,
-                message="Parameter validation failed",
-                suggestion="Check parameter types and values",
-                details=str(error),
-                should_retry=False,
-                user_actionable=True
-            )
+        Unlike classify_error this skips the suggestion and details text,
+        which are only needed once the error is about to be raised.
         
-        # Handle configuration errors
-        elif hasattr(error, '__class__') and 'ConfigurationError' in error.__class__.__name__:
-            return ErrorInfo(
-                category=ErrorCategory.CONFIGURATION,
-                severity=ErrorSeverity.CRITICAL,
-                message="Configuration error",
-                suggestion="Check environment variables and configuration settings",
-                details=str(error),
-                should_retry=False,
-                user_actionable=True
-            )
+        Args:
+            error: The exception to classify
+            
+        Returns:
+            Tuple of (category, message, should_retry, retry_after)
+        """
+        fast = _FAST_CLASSIFICATION.get(type(error))
+        if fast is not None:
+            return fast
         
-        # Generic error handling
-        else:
-            return ErrorInfo(
-                category=ErrorCategory.UNKNOWN,
-                severity=ErrorSeverity.MEDIUM,
-                message="Unexpected error occurred",
-                suggestion="Check logs for more details and try again",
-                details=str(error),
-                should_retry=True,
-                user_actionable=False
-            )
+        error_info = ErrorClassifier.classify_error(error)
+        return (
+            error_info.category,
+            error_info.message,
+            error_info.should_retry,
+            error_info.retry_after
+        )
     
     @staticmethod
     def _extract_retry_after(response: httpx.Response) -> Optional[int]:
@@ -256,6 +405,45 @@ class ErrorClassifier:
         return None
 
 
+def _fast_entry(error_type: type) -> Tuple[ErrorCategory, str, bool, Optional[int]]:
+    error_info = ErrorClassifier.classify_error(error_type(""))
+    return (
+        error_info.category,
+        error_info.message,
+        error_info.should_retry,
+        error_info.retry_after
+    )
+
+
+# Retry-relevant classification of error types whose ErrorInfo does not
+# depend on the instance, derived from the full classifiers so they agree
+_FAST_CLASSIFICATION = {
+    error_type: _fast_entry(error_type)
+    for error_type in (
+        LokiAuthenticationError,
+        LokiRateLimitError,
+        LokiQueryError,
+        LokiConnectionError,
+        httpx.ConnectError,
+        httpx.TimeoutException,
+        httpx.ConnectTimeout,
+        httpx.ReadTimeout,
+        httpx.WriteTimeout,
+        httpx.PoolTimeout,
+    )
+}
+
+
+# Number of leading attempts covered by the precomputed backoff tables
+_DELAY_TABLE_SIZE = 10
+
+
+@lru_cache(maxsize=16)
+def _delay_table(base_delay: float, max_delay: float) -> Tuple[float, ...]:
+    """Capped exponential delays for the first _DELAY_TABLE_SIZE attempts."""
+    return tuple(min(base_delay * (1 << i), max_delay) for i in range(_DELAY_TABLE_SIZE))
+
+
 class BackoffStrategy:
     """Implements various backoff strategies for retries."""
     
@@ -278,14 +466,15 @@ class BackoffStrategy:
         Returns:
             Delay in seconds
         """
-        import random
-        
-        delay = min(base_delay * (2 ** attempt), max_delay)
+        if 0 <= attempt < _DELAY_TABLE_SIZE:
+            delay = _delay_table(base_delay, max_delay)[attempt]
+        else:
+            delay = min(base_delay * (2 ** attempt), max_delay)
         
         if jitter:
             # Add ±25% jitter
             jitter_range = delay * 0.25
-            delay += random.uniform(-jitter_range, jitter_range)
+            delay += _uniform(-jitter_range, jitter_range)
         
         return max(0, delay)
     
@@ -325,18 +514,40 @@ class BackoffStrategy:
 class ErrorHandler:
     """Main error handler with retry logic and user-friendly messaging."""
     
-    def __init__(self, max_retries: int = 3, enable_circuit_breaker: bool = True):
+    __slots__ = (
+        "max_retries",
+        "_max_attempts",
+        "enable_circuit_breaker",
+        "circuit_breaker",
+        "error_stats",
+        "_rate_limited_until",
+    )
+    
+    def __init__(
+        self,
+        max_retries: int = 3,
+        enable_circuit_breaker: bool = True,
+        rate_limit_deadlines: Optional[Dict[str, float]] = None
+    ):
         """
         Initialize error handler.
         
         Args:
             max_retries: Maximum number of retry attempts
             enable_circuit_breaker: Whether to enable circuit breaker pattern
+            rate_limit_deadlines: Optional per-operation rate-limit deadlines
+                shared with other handlers, so concurrent calls through
+                different handlers wait out the same 429
         """
         self.max_retries = max_retries
+        self._max_attempts = max_retries + 1
         self.enable_circuit_breaker = enable_circuit_breaker
         self.circuit_breaker = CircuitBreaker() if enable_circuit_breaker else None
         self.error_stats = ErrorStatistics()
+        # Per-operation deadline of the current rate-limit wait
+        self._rate_limited_until: Dict[str, float] = (
+            rate_limit_deadlines if rate_limit_deadlines is not None else {}
+        )
     
     async def handle_with_retry(
         self,
@@ -360,23 +571,84 @@ class ErrorHandler:
         Raises:
             Exception: Final exception after all retries exhausted
         """
-        context.start_time = time.time()
-        last_error = None
+        context.start_time = _now()
         
         # Check circuit breaker
         if self.circuit_breaker and not self.circuit_breaker.can_execute():
             raise LokiConnectionError("Circuit breaker is open - too many recent failures")
         
-        for attempt in range(context.max_attempts):
+        return await self._run_attempts(operation, context, 0, args, kwargs)
+    
+    async def try_direct(
+        self,
+        operation: callable,
+        operation_name: str,
+        *args,
+        **kwargs
+    ) -> Any:
+        """
+        Execute operation without building an ErrorContext up front.
+        
+        While the circuit breaker is closed the first attempt runs directly;
+        a context is only created if that attempt fails, after which retries
+        continue exactly as in handle_with_retry.
+        
+        Args:
+            operation: Async function to execute
+            operation_name: Operation name for statistics and logging
+            *args: Arguments for the operation
+            **kwargs: Keyword arguments for the operation
+            
+        Returns:
+            Operation result, or DIRECT_FALLBACK if the circuit breaker is
+            not closed and the caller should use handle_with_retry instead
+        """
+        circuit_breaker = self.circuit_breaker
+        if circuit_breaker and circuit_breaker._state != _CBState.CLOSED:
+            return DIRECT_FALLBACK
+        
+        start_time = _now()
+        try:
+            result = await operation(*args, **kwargs)
+        except Exception as error:
+            context = ErrorContext(
+                operation_name,
+                max_attempts=self._max_attempts,
+                start_time=start_time
+            )
+            delay = self._handle_failure(error, context, 0)
+            await asyncio.sleep(delay)
+            return await self._run_attempts(operation, context, 1, args, kwargs)
+        
+        if circuit_breaker:
+            circuit_breaker.record_success()
+        
+        self.error_stats.record_success(operation_name, _now() - start_time)
+        
+        return result
+    
+    async def _run_attempts(
+        self,
+        operation: callable,
+        context: ErrorContext,
+        first_attempt: int,
+        args: tuple,
+        kwargs: Dict[str, Any]
+    ) -> Any:
+        """Run the retry loop starting from the given 0-based attempt."""
+        last_error = None
+        
+        for attempt in range(first_attempt, context.max_attempts):
             context.attempt = attempt + 1
             
             try:
-                logger.debug(
-                    "Executing operation",
-                    operation=context.operation,
-                    attempt=context.attempt,
-                    max_attempts=context.max_attempts
-                )
+                if _std_logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Executing operation",
+                        operation=context.operation,
+                        attempt=context.attempt,
+                        max_attempts=context.max_attempts
+                    )
                 
                 result = await operation(*args, **kwargs)
                 
@@ -385,61 +657,156 @@ class ErrorHandler:
                     self.circuit_breaker.record_success()
                 
                 # Record success statistics
-                duration = time.time() - context.start_time
+                duration = _now() - context.start_time
                 self.error_stats.record_success(context.operation, duration)
                 
                 return result
                 
             except Exception as error:
                 last_error = error
-                error_info = ErrorClassifier.classify_error(error, context)
-                
-                # Record error statistics
-                self.error_stats.record_error(context.operation, error_info.category)
-                
-                # Log the error
-                logger.warning(
-                    "Operation failed",
-                    operation=context.operation,
-                    attempt=context.attempt,
-                    error_category=error_info.category.value,
-                    error_message=error_info.message,
-                    should_retry=error_info.should_retry,
-                    error=str(error)
-                )
-                
-                # Check if we should retry
-                if not error_info.should_retry or attempt == context.max_attempts - 1:
-                    # Record failure in circuit breaker
-                    if self.circuit_breaker:
-                        self.circuit_breaker.record_failure()
-                    
-                    # Enhance error with user-friendly information
-                    enhanced_error = self._create_enhanced_error(error, error_info, context)
-                    raise enhanced_error
-                
-                # Calculate backoff delay
-                if error_info.retry_after:
-                    delay = error_info.retry_after
-                elif error_info.category == ErrorCategory.RATE_LIMIT:
-                    delay = BackoffStrategy.linear_backoff(attempt, 30.0, 300.0)
-                else:
-                    delay = BackoffStrategy.exponential_backoff(attempt)
-                
-                logger.info(
-                    "Retrying operation after delay",
-                    operation=context.operation,
-                    attempt=context.attempt,
-                    delay=delay,
-                    error_category=error_info.category.value
-                )
-                
+                delay = self._handle_failure(error, context, attempt)
                 await asyncio.sleep(delay)
         
         # This should never be reached, but just in case
         if last_error:
             raise last_error
     
+    def _handle_failure(
+        self,
+        error: Exception,
+        context: ErrorContext,
+        attempt: int
+    ) -> float:
+        """
+        Record a failed attempt and decide what happens next.
+        
+        Args:
+            error: Exception raised by the attempt
+            context: Error context information
+            attempt: 0-based attempt number that failed
+            
+        Returns:
+            Delay in seconds before the next attempt
+            
+        Raises:
+            Exception: Enhanced exception if the operation should not be retried
+        """
+        context.attempt = attempt + 1
+        category, message, should_retry, retry_after = ErrorClassifier.classify_error_fast(error)
+        category_value = _CATEGORY_KEYS[category]
+        
+        # Record error statistics
+        self.error_stats.record_error(context.operation, category)
+        
+        # Log the error
+        logger.warning(
+            "Operation failed",
+            operation=context.operation,
+            attempt=context.attempt,
+            error_category=category_value,
+            error_message=message,
+            should_retry=should_retry,
+            error=str(error)
+        )
+        
+        # Check if we should retry
+        if not should_retry or attempt >= context.max_attempts - 1:
+            # Record failure in circuit breaker
+            if self.circuit_breaker:
+                self.circuit_breaker.record_failure()
+            
+            # Enhance error with user-friendly information
+            error_info = ErrorClassifier.classify_error(error, context)
+            raise self._create_enhanced_error(error, error_info, context)
+        
+        # Calculate backoff delay
+        if retry_after:
+            delay = retry_after
+        elif category == ErrorCategory.RATE_LIMIT:
+            delay = BackoffStrategy.linear_backoff(attempt, 30.0, 300.0)
+        else:
+            delay = BackoffStrategy.exponential_backoff(attempt)
+        
+        if category == ErrorCategory.RATE_LIMIT:
+            # Calls rate limited while a wait is already pending for this
+            # operation retry together with it instead of starting their own
+            now = _now()
+            until = self._rate_limited_until.get(context.operation, 0.0)
+            if until > now:
+                delay = until - now
+            else:
+                self._rate_limited_until[context.operation] = now + delay
+        
+        logger.info(
+            "Retrying operation after delay",
+            operation=context.operation,
+            attempt=context.attempt,
+            delay=delay,
+            error_category=category_value
+        )
+        
+        return delay
+    
+    async def handle_once(
+        self,
+        operation: callable,
+        context: ErrorContext,
+        *args,
+        **kwargs
+    ) -> Any:
+        """
+        Execute operation a single time with error handling but no retries.
+        
+        Used when retries are disabled; skips the retry loop and backoff
+        bookkeeping while keeping circuit breaker, statistics and error
+        enhancement behaviour identical to handle_with_retry.
+        
+        Args:
+            operation: Async function to execute
+            context: Error context information
+            *args: Arguments for the operation
+            **kwargs: Keyword arguments for the operation
+            
+        Returns:
+            Operation result
+            
+        Raises:
+            Exception: Enhanced exception if the operation fails
+        """
+        context.start_time = _now()
+        
+        # Check circuit breaker
+        if self.circuit_breaker and not self.circuit_breaker.can_execute():
+            raise LokiConnectionError("Circuit breaker is open - too many recent failures")
+        
+        try:
+            result = await operation(*args, **kwargs)
+        except Exception as error:
+            error_info = ErrorClassifier.classify_error(error, context)
+            self.error_stats.record_error(context.operation, error_info.category)
+            
+            logger.warning(
+                "Operation failed",
+                operation=context.operation,
+                attempt=context.attempt,
+                error_category=_CATEGORY_KEYS[error_info.category],
+                error_message=error_info.message,
+                should_retry=False,
+                error=str(error)
+            )
+            
+            if self.circuit_breaker:
+                self.circuit_breaker.record_failure()
+            
+            raise self._create_enhanced_error(error, error_info, context)
+        
+        if self.circuit_breaker:
+            self.circuit_breaker.record_success()
+        
+        self.error_stats.record_success(context.operation, _now() - context.start_time)
+        
+        return result
+    
     def _create_enhanced_error(
         self, 
         original_error: Exception, 
@@ -458,18 +825,15 @@ class ErrorHandler:
             Enhanced exception
         """
         # Create user-friendly error message
-        message_parts = [error_info.message]
-        
-        if error_info.suggestion:
-            message_parts.append(f"Suggestion: {error_info.suggestion}")
-        
-        if error_info.details:
-            message_parts.append(f"Details: {error_info.details}")
-        
-        if context.attempt > 1:
-            message_parts.append(f"Failed after {context.attempt} attempts")
-        
-        enhanced_message = ". ".join(message_parts)
+        suggestion = error_info.suggestion
+        details = error_info.details
+        attempt = context.attempt
+        enhanced_message = ". ".join(filter(None, (
+            error_info.message,
+            "Suggestion: " + suggestion if suggestion else None,
+            "Details: " + details if details else None,
+            f"Failed after {attempt} attempts" if attempt > 1 else None
+        )))
         
         # Create appropriate exception type
         if error_info.category == ErrorCategory.AUTHENTICATION:
@@ -493,9 +857,32 @@ class ErrorHandler:
         return stats
 
 
+class _CBState(IntEnum):
+    """Circuit breaker states."""
+    CLOSED = 0
+    OPEN = 1
+    HALF_OPEN = 2
+
+
+# Public names of the circuit breaker states, indexed by _CBState
+_CB_STATE_NAMES = ("closed", "open", "half-open")
+_CB_STATES_BY_NAME = {name: _CBState(i) for i, name in enumerate(_CB_STATE_NAMES)}
+
+
 class CircuitBreaker:
     """Circuit breaker pattern implementation."""
     
+    __slots__ = (
+        "failure_threshold",
+        "recovery_timeout",
+        "success_threshold",
+        "failure_count",
+        "success_count",
+        "last_failure_time",
+        "_last_failure_at",
+        "_state",
+    )
+    
     def __init__(
         self, 
         failure_threshold: int = 5, 
@@ -516,16 +903,29 @@ class CircuitBreaker:
         
         self.failure_count = 0
         self.success_count = 0
+        # Wall-clock time of the last failure, for status reports
         self.last_failure_time = 0
-        self.state = "closed"  # closed, open, half-open
+        # Monotonic time of the last failure, for the recovery timeout
+        self._last_failure_at = 0
+        self._state = _CBState.CLOSED
+    
+    @property
+    def state(self) -> str:
+        """Current state name: "closed", "open" or "half-open"."""
+        return _CB_STATE_NAMES[self._state]
+    
+    @state.setter
+    def state(self, value: str) -> None:
+        self._state = _CB_STATES_BY_NAME[value]
     
     def can_execute(self) -> bool:
         """Check if operation can be executed."""
-        if self.state == "closed":
+        state = self._state
+        if state == _CBState.CLOSED:
             return True
-        elif self.state == "open":
-            if time.time() - self.last_failure_time >= self.recovery_timeout:
-                self.state = "half-open"
+        elif state == _CBState.OPEN:
+            if _now() - self._last_failure_at >= self.recovery_timeout:
+                self._state = _CBState.HALF_OPEN
                 self.success_count = 0
                 return True
             return False
@@ -534,23 +934,26 @@ class CircuitBreaker:
     
     def record_success(self) -> None:
         """Record successful operation."""
-        if self.state == "half-open":
+        state = self._state
+        if state == _CBState.HALF_OPEN:
             self.success_count += 1
             if self.success_count >= self.success_threshold:
-                self.state = "closed"
+                self._state = _CBState.CLOSED
                 self.failure_count = 0
-        elif self.state == "closed":
+        elif state == _CBState.CLOSED:
             self.failure_count = max(0, self.failure_count - 1)
     
     def record_failure(self) -> None:
         """Record failed operation."""
         self.failure_count += 1
+        self._last_failure_at = _now()
         self.last_failure_time = time.time()
         
-        if self.state == "closed" and self.failure_count >= self.failure_threshold:
-            self.state = "open"
-        elif self.state == "half-open":
-            self.state = "open"
+        state = self._state
+        if state == _CBState.CLOSED and self.failure_count >= self.failure_threshold:
+            self._state = _CBState.OPEN
+        elif state == _CBState.HALF_OPEN:
+            self._state = _CBState.OPEN
     
     def get_status(self) -> Dict[str, Any]:
         """Get circuit breaker status."""
@@ -563,56 +966,73 @@ class CircuitBreaker:
         }
 
 
+@dataclass(**_SLOTS)
+class _OpStat:
+    """Per-operation counters kept by ErrorStatistics."""
+    success_count: int = 0
+    error_count: int = 0
+    total_duration: float = 0.0
+
+
 class ErrorStatistics:
     """Tracks error statistics for monitoring and debugging."""
     
+    __slots__ = ("operation_stats", "error_counts", "start_time")
+    
     def __init__(self):
         """Initialize error statistics."""
-        self.operation_stats: Dict[str, Dict[str, Any]] = {}
+        self.operation_stats: Dict[str, _OpStat] = defaultdict(_OpStat)
         self.error_counts: Dict[str, int] = {}
-        self.start_time = time.time()
+        self.start_time = _now()
     
     def record_success(self, operation: str, duration: float) -> None:
         """Record successful operation."""
-        if operation not in self.operation_stats:
-            self.operation_stats[operation] = {
-                "success_count": 0,
-                "error_count": 0,
-                "total_duration": 0.0,
-                "avg_duration": 0.0
-            }
-        
         stats = self.operation_stats[operation]
-        stats["success_count"] += 1
-        stats["total_duration"] += duration
-        stats["avg_duration"] = stats["total_duration"] / stats["success_count"]
+        stats.success_count += 1
+        stats.total_duration += duration
     
     def record_error(self, operation: str, error_category: ErrorCategory) -> None:
         """Record error for operation."""
-        if operation not in self.operation_stats:
-            self.operation_stats[operation] = {
-                "success_count": 0,
-                "error_count": 0,
-                "total_duration": 0.0,
-                "avg_duration": 0.0
-            }
+        self.operation_stats[operation].error_count += 1
         
-        self.operation_stats[operation]["error_count"] += 1
-        
-        category_key = error_category.value
+        category_key = _CATEGORY_KEYS[error_category]
         self.error_counts[category_key] = self.error_counts.get(category_key, 0) + 1
     
     def get_statistics(self) -> Dict[str, Any]:
-        """Get comprehensive statistics."""
-        uptime = time.time() - self.start_time
+        """
+        Get comprehensive statistics.
+        
+        error_counts_by_category is a read-only live view of the counters
+        rather than a copy; use snapshot() for an independent copy.
+        """
+        uptime = _now() - self.start_time
+        
+        operation_stats = {
+            operation: {
+                "success_count": stats.success_count,
+                "error_count": stats.error_count,
+                "total_duration": stats.total_duration,
+                "avg_duration": (
+                    stats.total_duration / stats.success_count
+                    if stats.success_count else 0.0
+                )
+            }
+            for operation, stats in self.operation_stats.items()
+        }
         
         return {
             "uptime_seconds": uptime,
-            "operation_stats": self.operation_stats.copy(),
-            "error_counts_by_category": self.error_counts.copy(),
+            "operation_stats": operation_stats,
+            "error_counts_by_category": MappingProxyType(self.error_counts),
             "total_operations": sum(
-                stats["success_count"] + stats["error_count"] 
+                stats.success_count + stats.error_count
                 for stats in self.operation_stats.values()
             ),
             "total_errors": sum(self.error_counts.values())
-        }
\ No newline at end of file
+        }
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """Get statistics with plain dict copies that later errors do not affect."""
+        stats = self.get_statistics()
+        stats["error_counts_by_category"] = dict(stats["error_counts_by_category"])
+        return stats
@@ -1,36 +1,134 @@
 """Logging configuration for the Loki MCP server."""
 
+import json
 import logging
+import os
+import re
 import sys
-from typing import Any, Dict, Optional
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 import structlog
 from structlog.stdlib import LoggerFactory
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
 
-def configure_logging(
-    level: str = "INFO",
-    format_json: bool = False,
-    include_timestamp: bool = True,
-    include_caller: bool = False,
-    extra_processors: Optional[list] = None
-) -> None:
+# Keys whose values are redacted. Compound names such as api_key or
+# bearer_token are covered by their substrings.
+_SENSITIVE_KEY_RE = re.compile(r"password|token|secret|key|auth|credential", re.IGNORECASE)
+
+# Long runs of word characters and dashes that look like tokens
+_TOKENISH_RE = re.compile(r"[\w-]{21,}")
+
+_STACK_INFO_RENDERER = structlog.processors.StackInfoRenderer()
+
+# Longest time buffered log output waits before it is flushed
+_FLUSH_INTERVAL = 0.1
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
     """
-    Configure structured logging for the Loki MCP server.
+    Stream handler that batches writes instead of flushing every record.
     
-    Args:
-        level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
-        format_json: Whether to output logs in JSON format
-        include_timestamp: Whether to include timestamps in logs
-        include_caller: Whether to include caller information
-        extra_processors: Additional log processors
+    Records are left in the stream's buffer and flushed when a WARNING or
+    more severe record is emitted, or by a timer at most ``flush_interval``
+    seconds after the first unflushed record, so output reaches the stream
+    even when the server goes idle. Closing the handler, which logging does
+    for all handlers on interpreter exit, flushes what is left.
     """
-    # Configure standard library logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, level.upper())
-    )
     
+    def __init__(self, stream=None, flush_interval: float = _FLUSH_INTERVAL):
+        """
+        Initialize the handler.
+        
+        Args:
+            stream: Stream to write to (defaults to sys.stderr)
+            flush_interval: Longest time in seconds a routine record stays buffered
+        """
+        super().__init__(stream)
+        self.flush_interval = flush_interval
+        self._flush_timer: Optional[threading.Timer] = None
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record, flushing now or scheduling a timed flush."""
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.WARNING:
+                self.flush()
+            elif self._flush_timer is None:
+                # emit runs under the handler lock, so one timer is pending
+                # at a time
+                self._flush_timer = threading.Timer(self.flush_interval, self._timed_flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+    
+    def _timed_flush(self) -> None:
+        """Flush buffered records from the timer thread."""
+        self.acquire()
+        try:
+            self._flush_timer = None
+        finally:
+            self.release()
+        self.flush()
+    
+    def close(self) -> None:
+        """Cancel any pending timed flush and flush buffered records."""
+        self.acquire()
+        try:
+            timer, self._flush_timer = self._flush_timer, None
+        finally:
+            self.release()
+        if timer is not None:
+            timer.cancel()
+        self.flush()
+        super().close()
+
+
+def _orjson_dumps(obj, **kwargs) -> str:
+    """
+    Serialize with orjson, decoded for the stdlib logger.
+    
+    Non-string keys are stringified as json.dumps would. Anything else
+    orjson rejects, such as integers beyond 64 bits, falls back to
+    json.dumps, so a log call never raises where the stdlib renderer would
+    not.
+    """
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, **kwargs).decode()
+    except TypeError:
+        return json.dumps(obj, **kwargs)
+
+
+def _render_exc_info(logger, method_name, event_dict):
+    """Render stack and exception info, skipping events that carry neither."""
+    if method_name == "exception" or "exc_info" in event_dict or "stack_info" in event_dict:
+        event_dict = _STACK_INFO_RENDERER(logger, method_name, event_dict)
+        event_dict = structlog.dev.set_exc_info(logger, method_name, event_dict)
+        event_dict = structlog.processors.format_exc_info(logger, method_name, event_dict)
+    return event_dict
+
+
+@lru_cache(maxsize=None)
+def _build_processors(
+    format_json: bool,
+    include_timestamp: bool,
+    include_caller: bool,
+    extra_processors: Tuple[Any, ...]
+) -> Tuple[Any, ...]:
+    """
+    Build the processor chain for the given options.
+    
+    Cached so that reconfiguring with the same options reuses the same
+    processor instances instead of constructing new ones.
+    """
     # Build processor chain
     processors = []
     
@@ -51,31 +149,113 @@ def configure_logging(
         ))
     
     # Add custom processors
-    if extra_processors:
-        processors.extend(extra_processors)
+    processors.extend(extra_processors)
     
     # Add error handling processors
-    processors.extend([
-        structlog.processors.StackInfoRenderer(),
-        structlog.dev.set_exc_info,
-        structlog.processors.format_exc_info,
-    ])
+    processors.append(_render_exc_info)
     
     # Choose output format
     if format_json:
-        processors.append(structlog.processors.JSONRenderer())
+        if orjson is not None:
+            processors.append(structlog.processors.JSONRenderer(serializer=_orjson_dumps))
+        else:
+            processors.append(structlog.processors.JSONRenderer())
     else:
         processors.append(structlog.dev.ConsoleRenderer(colors=True))
     
-    # Configure structlog
+    return tuple(processors)
+
+
+def configure_logging(
+    level: str = "INFO",
+    format_json: bool = False,
+    include_timestamp: bool = True,
+    include_caller: bool = False,
+    extra_processors: Optional[list] = None
+) -> None:
+    """
+    Configure structured logging for the Loki MCP server.
+    
+    Args:
+        level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        format_json: Whether to output logs in JSON format
+        include_timestamp: Whether to include timestamps in logs
+        include_caller: Whether to include caller information
+        extra_processors: Additional log processors
+    """
+    min_level = getattr(logging, level.upper())
+    
+    # Configure standard library logging
+    logging.basicConfig(
+        format="%(message)s",
+        handlers=[_BufferedStreamHandler(sys.stdout)],
+        level=min_level
+    )
+    
+    extra = tuple(extra_processors or ())
+    try:
+        processors = _build_processors(format_json, include_timestamp, include_caller, extra)
+    except TypeError:
+        # Unhashable extra processors cannot be cached
+        processors = _build_processors.__wrapped__(format_json, include_timestamp, include_caller, extra)
+    
+    # Configure structlog; calls below min_level return before any processor runs
     structlog.configure(
-        processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        processors=list(processors),
+        wrapper_class=structlog.make_filtering_bound_logger(min_level),
         logger_factory=LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
+# Log methods whose events get an error category
+_ERROR_METHODS = frozenset(('error', 'critical', 'exception'))
+
+# Error categories for the client exceptions, keyed by class name as logged in
+# 'error_type'; other errors are categorised from their message.
+_ERROR_CATEGORY_BY_TYPE = {
+    'LokiConnectionError': 'connection',
+    'LokiAuthenticationError': 'authentication',
+    'LokiRateLimitError': 'rate_limit',
+    'LokiQueryError': 'query',
+}
+
+
+def _categorize_error_message(message: str) -> str:
+    """Categorize an error from its lowercased message."""
+    if 'connection' in message:
+        return 'connection'
+    if 'auth' in message:
+        return 'authentication'
+    if 'rate' in message and 'limit' in message:
+        return 'rate_limit'
+    if 'timeout' in message:
+        return 'timeout'
+    if 'query' in message or 'logql' in message:
+        return 'query'
+    return 'unknown'
+
+
+def _add_error_context(logger, method_name, event_dict):
+    """Add error context information to log entries."""
+    # Only error-level logs carrying an error are categorized
+    if method_name not in _ERROR_METHODS or 'error' not in event_dict:
+        return event_dict
+    
+    error = event_dict['error']
+    error_type = event_dict.get('error_type')
+    if error_type is None and isinstance(error, BaseException):
+        error_type = type(error).__name__
+    
+    # Categorize by exception type, falling back to the message
+    category = _ERROR_CATEGORY_BY_TYPE.get(error_type)
+    if category is None:
+        category = _categorize_error_message(str(error).lower())
+    event_dict['error_category'] = category
+    
+    return event_dict
+
+
 def get_error_context_processor():
     """
     Create a processor that adds error context to log entries.
@@ -83,30 +263,33 @@ def get_error_context_processor():
     Returns:
         Log processor function
     """
-    def add_error_context(logger, method_name, event_dict):
-        """Add error context information to log entries."""
-        # Add error categorization for error-level logs
-        if method_name in ('error', 'critical', 'exception'):
-            if 'error' in event_dict:
-                error = event_dict['error']
-                
-                # Try to categorize the error
-                if 'connection' in str(error).lower():
-                    event_dict['error_category'] = 'connection'
-                elif 'auth' in str(error).lower():
-                    event_dict['error_category'] = 'authentication'
-                elif 'rate' in str(error).lower() and 'limit' in str(error).lower():
-                    event_dict['error_category'] = 'rate_limit'
-                elif 'timeout' in str(error).lower():
-                    event_dict['error_category'] = 'timeout'
-                elif 'query' in str(error).lower() or 'logql' in str(error).lower():
-                    event_dict['error_category'] = 'query'
-                else:
-                    event_dict['error_category'] = 'unknown'
-        
+    return _add_error_context
+
+
+def _add_performance_metrics(logger, method_name, event_dict):
+    """Add performance metrics to log entries."""
+    # Add duration formatting for operations with duration
+    duration = event_dict.get('duration')
+    if not isinstance(duration, (int, float)):
         return event_dict
     
-    return add_error_context
+    if duration < 1:
+        event_dict['duration_formatted'] = f"{duration*1000:.1f}ms"
+    else:
+        event_dict['duration_formatted'] = f"{duration:.2f}s"
+    
+    # Add operation timing categories
+    if 'operation' in event_dict:
+        if duration < 0.1:
+            event_dict['performance_category'] = 'fast'
+        elif duration < 1.0:
+            event_dict['performance_category'] = 'normal'
+        elif duration < 5.0:
+            event_dict['performance_category'] = 'slow'
+        else:
+            event_dict['performance_category'] = 'very_slow'
+    
+    return event_dict
 
 
 def get_performance_processor():
@@ -116,33 +299,66 @@ def get_performance_processor():
     Returns:
         Log processor function
     """
-    def add_performance_metrics(logger, method_name, event_dict):
-        """Add performance metrics to log entries."""
-        # Add duration formatting for operations with duration
-        if 'duration' in event_dict:
-            duration = event_dict['duration']
-            if isinstance(duration, (int, float)):
-                if duration < 1:
-                    event_dict['duration_formatted'] = f"{duration*1000:.1f}ms"
-                else:
-                    event_dict['duration_formatted'] = f"{duration:.2f}s"
-        
-        # Add operation timing categories
-        if 'operation' in event_dict and 'duration' in event_dict:
-            duration = event_dict['duration']
-            if isinstance(duration, (int, float)):
-                if duration < 0.1:
-                    event_dict['performance_category'] = 'fast'
-                elif duration < 1.0:
-                    event_dict['performance_category'] = 'normal'
-                elif duration < 5.0:
-                    event_dict['performance_category'] = 'slow'
-                else:
-                    event_dict['performance_category'] = 'very_slow'
-        
-        return event_dict
+    return _add_performance_metrics
+
+
+def _needs_sanitizing(d: dict) -> bool:
+    """Return whether any value in a (nested) dictionary would be redacted."""
+    stack = [d]
+    seen = {id(d)}
+    while stack:
+        for key, value in stack.pop().items():
+            if _SENSITIVE_KEY_RE.search(key):
+                if value:
+                    return True
+            elif isinstance(value, dict):
+                if id(value) not in seen:
+                    seen.add(id(value))
+                    stack.append(value)
+            elif isinstance(value, str) and _TOKENISH_RE.fullmatch(value):
+                return True
+    return False
+
+
+def _sanitize_dict(d):
+    """
+    Sanitize dictionary values, including nested dictionaries.
     
-    return add_performance_metrics
+    Dictionaries with nothing to redact are returned as-is. Otherwise a
+    sanitized copy is built with an explicit stack rather than recursion,
+    leaving the caller's nested dictionaries untouched.
+    """
+    if not isinstance(d, dict) or not _needs_sanitizing(d):
+        return d
+    
+    sanitized = {}
+    copies = {id(d): sanitized}
+    stack = [(d, sanitized)]
+    while stack:
+        source, target = stack.pop()
+        for key, value in source.items():
+            # Check if key contains sensitive information
+            if _SENSITIVE_KEY_RE.search(key):
+                target[key] = "***REDACTED***" if value else value
+            elif isinstance(value, dict):
+                copy = copies.get(id(value))
+                if copy is None:
+                    copy = copies[id(value)] = {}
+                    stack.append((value, copy))
+                target[key] = copy
+            elif isinstance(value, str) and _TOKENISH_RE.fullmatch(value):
+                # String looks like a token (long alphanumeric string)
+                target[key] = f"{value[:8]}***REDACTED***"
+            else:
+                target[key] = value
+    
+    return sanitized
+
+
+def _sanitize_sensitive_data(logger, method_name, event_dict):
+    """Remove or mask sensitive information from log entries."""
+    # Sanitize the entire event dict
+    return _sanitize_dict(event_dict)
 
 
 def get_security_processor():
@@ -152,50 +368,17 @@ def get_security_processor():
     Returns:
         Log processor function
     """
-    def sanitize_sensitive_data(logger, method_name, event_dict):
-        """Remove or mask sensitive information from log entries."""
-        sensitive_keys = {
-            'password', 'token', 'secret', 'key', 'auth', 'credential',
-            'bearer_token', 'api_key', 'access_token', 'refresh_token'
-        }
-        
-        def sanitize_dict(d):
-            """Recursively sanitize dictionary values."""
-            if not isinstance(d, dict):
-                return d
-            
-            sanitized = {}
-            for key, value in d.items():
-                key_lower = key.lower()
-                
-                # Check if key contains sensitive information
-                if any(sensitive in key_lower for sensitive in sensitive_keys):
-                    if value:
-                        sanitized[key] = "***REDACTED***"
-                    else:
-                        sanitized[key] = value
-                elif isinstance(value, dict):
-                    sanitized[key] = sanitize_dict(value)
-                elif isinstance(value, str) and len(value) > 20:
-                    # Check if string looks like a token (long alphanumeric string)
-                    if value.replace('-', '').replace('_', '').isalnum():
-                        sanitized[key] = f"{value[:8]}***REDACTED***"
-                    else:
-                        sanitized[key] = value
-                else:
-                    sanitized[key] = value
-            
-            return sanitized
-        
-        # Sanitize the entire event dict
-        return sanitize_dict(event_dict)
-    
-    return sanitize_sensitive_data
+    return _sanitize_sensitive_data
 
 
 class StructuredLogger:
     """Enhanced structured logger with error handling context."""
     
+    __slots__ = ("logger",)
+    
+    # Loggers shared by every StructuredLogger with the same name
+    _loggers: Dict[str, Any] = {}
+    
     def __init__(self, name: str):
         """
         Initialize structured logger.
@@ -203,7 +386,10 @@ class StructuredLogger:
         Args:
             name: Logger name
         """
-        self.logger = structlog.get_logger(name)
+        logger = self._loggers.get(name)
+        if logger is None:
+            logger = self._loggers[name] = structlog.get_logger(name)
+        self.logger = logger
     
     def log_operation_start(
         self, 
@@ -220,11 +406,9 @@ class StructuredLogger:
         Returns:
             Operation context for tracking
         """
-        import time
-        
         context = {
             'operation': operation,
-            'start_time': time.time(),
+            'start_time': time.monotonic(),
             **kwargs
         }
         
@@ -249,9 +433,7 @@ class StructuredLogger:
             result_summary: Optional summary of results
             **kwargs: Additional context
         """
-        import time
-        
-        duration = time.time() - context['start_time']
+        duration = time.monotonic() - context['start_time']
         
         log_data = {
             **context,
@@ -282,9 +464,7 @@ class StructuredLogger:
             error: Exception that occurred
             **kwargs: Additional context
         """
-        import time
-        
-        duration = time.time() - context['start_time']
+        duration = time.monotonic() - context['start_time']
         
         log_data = {
             **context,
@@ -360,8 +540,6 @@ def setup_default_logging(level: Optional[str] = None) -> None:
     Args:
         level: Optional log level override
     """
-    import os
-    
     # Get configuration from environment or parameter
     log_level = (level or os.getenv('LOKI_LOG_LEVEL', 'INFO')).upper()
     log_format = os.getenv('LOKI_LOG_FORMAT', 'console').lower()
@@ -375,17 +553,12 @@ def setup_default_logging(level: Optional[str] = None) -> None:
             level=logging.CRITICAL
         )
         
-        # Configure structlog with minimal processors that don't output to stdout
+        # Filter everything below CRITICAL before it reaches a processor; with
+        # no processors and a ReturnLogger, nothing is ever written anywhere
         structlog.configure(
-            processors=[
-                structlog.stdlib.add_log_level,
-                structlog.stdlib.PositionalArgumentsFormatter(),
-                structlog.processors.StackInfoRenderer(),
-                structlog.processors.format_exc_info,
-                lambda logger, method_name, event_dict: ""  # Drop all log output
-            ],
-            wrapper_class=structlog.stdlib.BoundLogger,
-            logger_factory=LoggerFactory(),
+            processors=[],
+            wrapper_class=structlog.make_filtering_bound_logger(logging.CRITICAL),
+            logger_factory=structlog.ReturnLoggerFactory(),
             cache_logger_on_first_use=True,
         )
         return
@@ -1,17 +1,49 @@
 """HTTP client for Loki API communication."""
 
 import asyncio
+import json
 import time
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urljoin
+import weakref
+from collections import Counter, deque
+from functools import lru_cache
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple, Type, Union
+from urllib.parse import quote
 
-import requests
+import httpx
 import structlog
 
+try:
+    import orjson
+except ImportError:  # optional speedup
+    orjson = None
+
 from .config import LokiConfig
 
 logger = structlog.get_logger(__name__)
 
+# Decoder for successful response bodies
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+# Query string as (name, value) pairs, passed to httpx without a dict round trip
+QueryParams = List[Tuple[str, Any]]
+
+# Loki API endpoint paths, appended to the configured base URL
+_QUERY_RANGE_PATH = "/loki/api/v1/query_range"
+_QUERY_PATH = "/loki/api/v1/query"
+_LABELS_PATH = "/loki/api/v1/labels"
+_LABEL_VALUES_PATH = "/loki/api/v1/label/{}/values"
+_SERIES_PATH = "/loki/api/v1/series"
+
+
+@lru_cache(maxsize=None)
+def _ssl_context():
+    """Return the TLS context shared by all sessions.
+    
+    Loading the CA bundle dominates ``httpx.AsyncClient`` construction, so it
+    is done once per process rather than once per client.
+    """
+    return httpx.create_ssl_context()
+
 
 class LokiClientError(Exception):
     """Base exception for Loki client errors."""
@@ -39,7 +71,9 @@ class LokiRateLimitError(LokiClientError):
 
 
 class RateLimiter:
-    """Rate limiter for controlling request frequency."""
+    """Sliding-window rate limiter for controlling request frequency."""
+    
+    __slots__ = ("max_requests", "time_window", "requests", "_lock")
     
     def __init__(self, max_requests: int, time_window: float):
         """
@@ -51,7 +85,16 @@ class RateLimiter:
         """
         self.max_requests = max_requests
         self.time_window = time_window
-        self.requests: List[float] = []
+        # Request times in the order they were made, oldest first
+        self.requests: Deque[float] = deque()
+        self._lock = asyncio.Lock()
+    
+    def _expire(self, now: float) -> None:
+        """Drop requests that have left the time window."""
+        requests = self.requests
+        window = self.time_window
+        while requests and now - requests[0] >= window:
+            requests.popleft()
     
     async def acquire(self) -> None:
         """
@@ -59,38 +102,45 @@ class RateLimiter:
         
         This method will block if the rate limit would be exceeded.
         """
-        now = time.time()
-        
-        # Clean up old requests outside the time window
-        self.requests = [req_time for req_time in self.requests 
-                        if now - req_time < self.time_window]
-        
-        # If we're at the limit, wait until we can make another request
-        if len(self.requests) >= self.max_requests:
-            # Calculate how long to wait
-            oldest_request = min(self.requests)
-            wait_time = self.time_window - (now - oldest_request)
+        async with self._lock:
+            now = time.monotonic()
+            self._expire(now)
             
-            if wait_time > 0:
+            # If we're at the limit, wait until the oldest request leaves the window
+            if len(self.requests) >= self.max_requests:
+                wait_time = self.time_window - (now - self.requests[0])
+                logger.debug("Rate limit reached, waiting", wait_time=wait_time)
                 await asyncio.sleep(wait_time)
-                # Update now after sleeping
-                now = time.time()
-                # Clean up again after waiting
-                self.requests = [req_time for req_time in self.requests 
-                               if now - req_time < self.time_window]
-        
-        # Record this request
-        self.requests.append(now)
+                now = time.monotonic()
+                self._expire(now)
+            
+            # Record this request
+            self.requests.append(now)
 
 
-class LokiQueryError(LokiClientError):
-    """Raised when query execution fails."""
-    pass
+# Transport errors by httpx exception type: (category, message prefix).
+# Looked up along the exception's MRO; anything else is a generic "request".
+_TRANSPORT_ERRORS: Dict[type, Tuple[str, str]] = {
+    httpx.ConnectError: ("connection", "Failed to connect to Loki"),
+    httpx.TimeoutException: ("timeout", "Request to Loki timed out"),
+}
+_DEFAULT_TRANSPORT_ERROR = ("request", "Request to Loki failed")
 
+# HTTP status codes with a dedicated error: (category, exception, message).
+# Other 4xx/5xx responses are reported as query errors.
+_STATUS_ERRORS: Dict[int, Tuple[str, Type[LokiClientError], str]] = {
+    401: ("authentication", LokiAuthenticationError, "Authentication failed. Check your credentials."),
+    429: ("rate_limit", LokiRateLimitError, "Rate limit exceeded. Please reduce request frequency."),
+}
 
-class LokiRateLimitError(LokiClientError):
-    """Raised when rate limit is exceeded."""
-    pass
+
+def _transport_error(error: Exception) -> Tuple[str, str]:
+    """Return the category and message prefix for an httpx transport error."""
+    for cls in type(error).__mro__:
+        entry = _TRANSPORT_ERRORS.get(cls)
+        if entry is not None:
+            return entry
+    return _DEFAULT_TRANSPORT_ERROR
 
 
 class LokiClient:
@@ -103,15 +153,26 @@ class LokiClient:
             config: Loki configuration object
         """
         self.config = config
-        self._session: Optional[requests.Session] = None
+        # Endpoint paths are appended to this instead of urljoin-ing per request
+        self._base_url = config.url.rstrip('/')
+        # Sessions by event loop; _session is the one last used
+        self._sessions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._session: Optional[httpx.AsyncClient] = None
         self._rate_limiter = RateLimiter(
             max_requests=config.rate_limit_requests,
             time_window=config.rate_limit_period
         )
+        # Semaphores bounding the fan-out of the *_many helpers, by event
+        # loop; created on first use, as on Python < 3.10 a semaphore binds
+        # to the loop current at construction
+        self._semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
         # Statistics tracking
         self._total_operations = 0
         self._total_errors = 0
-        self._error_counts_by_category = {}
+        self._error_counts_by_category: Counter = Counter()
+        # Per-operation deadlines of pending rate-limit waits, shared by the
+        # error handlers of every EnhancedLokiClient wrapping this client
+        self.rate_limit_deadlines: Dict[str, float] = {}
 
         
     async def __aenter__(self):
@@ -123,35 +184,81 @@ class LokiClient:
         """Async context manager exit."""
         await self.close()
 
-    async def _ensure_session(self) -> None:
-        """Ensure HTTP session is initialized."""
-        if self._session is None:
-            self._session = requests.Session()
-            
-            # Set headers
-            self._session.headers.update({
-                "User-Agent": "loki-mcp-server/0.1.0",
-                "Accept": "application/json",
-                "Content-Type": "application/json"
-            })
-            
-            # Set authentication
-            if self.config.username and self.config.password:
-                self._session.auth = (self.config.username, self.config.password)
-            elif self.config.bearer_token:
-                self._session.headers["Authorization"] = f"Bearer {self.config.bearer_token}"
+    def _create_session(self) -> httpx.AsyncClient:
+        """Create a pooled HTTP session with the configured authentication."""
+        headers = {
+            "User-Agent": "loki-mcp-server/0.1.0",
+            "Accept": "application/json",
+            "Content-Type": "application/json"
+        }
+        auth = None
+        
+        # Set authentication
+        if self.config.username and self.config.password:
+            auth = httpx.BasicAuth(self.config.username, self.config.password)
+        elif self.config.bearer_token:
+            headers["Authorization"] = f"Bearer {self.config.bearer_token}"
+        
+        return httpx.AsyncClient(
+            headers=headers,
+            auth=auth,
+            timeout=self.config.timeout,
+            verify=_ssl_context(),
+            # requests followed redirects by default; keep that for proxies
+            # and path rewrites in front of Loki
+            follow_redirects=True
+        )
+
+    async def _ensure_session(self) -> httpx.AsyncClient:
+        """Ensure an HTTP session is initialized for the running event loop.
+        
+        The session is a pooled ``httpx.AsyncClient`` so requests run on the
+        event loop and reuse keep-alive connections to Loki. Its connections
+        belong to the loop that opened them, so each loop gets its own
+        session, created on first use and kept for the lifetime of the loop.
+        
+        Returns:
+            The session for the running loop
+        """
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.is_closed:
+            session = self._sessions[loop] = self._create_session()
+        self._session = session
+        return session
+
+    def _concurrency(self) -> asyncio.Semaphore:
+        """Return the fan-out semaphore of the running event loop."""
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(
+                self.config.rate_limit_requests
+            )
+        return semaphore
 
     async def close(self) -> None:
-        """Close the HTTP session."""
-        if self._session:
-            self._session.close()
-            self._session = None
+        """Close the HTTP session of the running event loop.
+        
+        Sessions opened on other loops are dropped rather than closed, as
+        their connections can only be closed from their own loop.
+        """
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        self._sessions.clear()
+        self._session = None
+        if session is not None:
+            await session.aclose()
+
+    def _record_error(self, category: str) -> None:
+        """Count a failed request under the given category."""
+        self._total_errors += 1
+        self._error_counts_by_category[category] += 1
 
     async def _make_request(
         self, 
         method: str, 
         endpoint: str, 
-        params: Optional[Dict[str, Any]] = None,
+        params: Optional[QueryParams] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """Make HTTP request to Loki API.
@@ -159,8 +266,8 @@ class LokiClient:
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint path
-            params: Query parameters
-            **kwargs: Additional arguments for requests
+            params: Query parameters as (name, value) pairs
+            **kwargs: Additional arguments for httpx
             
         Returns:
             Response data as dictionary
@@ -171,10 +278,12 @@ class LokiClient:
             LokiQueryError: When query fails
             LokiRateLimitError: When rate limited
         """
-        await self._ensure_session()
+        session = await self._ensure_session()
         await self._rate_limiter.acquire()
         
-        url = urljoin(self.config.url.rstrip('/') + '/', endpoint.lstrip('/'))
+        if endpoint[:1] != '/':
+            endpoint = '/' + endpoint
+        url = self._base_url + endpoint
         
         logger.debug(
             "Making request to Loki",
@@ -185,58 +294,45 @@ class LokiClient:
         # Track operation
         self._total_operations += 1
         
-        # Use asyncio.to_thread to run the synchronous requests call in a thread
-        def make_sync_request():
-            return self._session.request(
-                method=method,
-                url=url,
+        try:
+            response = await session.request(
+                method,
+                url,
                 params=params,
-                timeout=self.config.timeout,
                 **kwargs
             )
+        except httpx.RequestError as e:
+            category, prefix = _transport_error(e)
+            self._record_error(category)
+            raise LokiConnectionError(f"{prefix}: {e}")
+        
+        # Handle different HTTP status codes
+        status_code = response.status_code
+        if status_code == 200:
+            return _json_loads(response.content)
+        
+        # Other 2xx replies are only usable if they carry a JSON body
+        if 200 < status_code < 300 and response.content:
+            return _json_loads(response.content)
         
+        status_error = _STATUS_ERRORS.get(status_code)
+        if status_error is not None:
+            category, error_class, message = status_error
+            self._record_error(category)
+            raise error_class(message)
+        
+        # Anything else, including empty 2xx and unfollowed 3xx replies,
+        # is an error; callers expect a JSON object
+        self._record_error("query")
+        error_msg = f"Loki API error: {response.status_code}"
         try:
-            response = await asyncio.to_thread(make_sync_request)
-        except requests.exceptions.ConnectionError as e:
-            self._total_errors += 1
-            self._error_counts_by_category["connection"] = self._error_counts_by_category.get("connection", 0) + 1
-            raise LokiConnectionError(f"Failed to connect to Loki: {e}")
-        except requests.exceptions.Timeout as e:
-            self._total_errors += 1
-            self._error_counts_by_category["timeout"] = self._error_counts_by_category.get("timeout", 0) + 1
-            raise LokiConnectionError(f"Request to Loki timed out: {e}")
-        except requests.exceptions.RequestException as e:
-            self._total_errors += 1
-            self._error_counts_by_category["request"] = self._error_counts_by_category.get("request", 0) + 1
-            raise LokiConnectionError(f"Request to Loki failed: {e}")
+            error_data = response.json()
+            if "error" in error_data:
+                error_msg += f" - {error_data['error']}"
+        except Exception:
+            error_msg += f" - {response.text}"
         
-        # Handle different HTTP status codes
-        if response.status_code == 200:
-            return response.json()
-        elif response.status_code == 401:
-            self._total_errors += 1
-            self._error_counts_by_category["authentication"] = self._error_counts_by_category.get("authentication", 0) + 1
-            raise LokiAuthenticationError(
-                "Authentication failed. Check your credentials."
-            )
-        elif response.status_code == 429:
-            self._total_errors += 1
-            self._error_counts_by_category["rate_limit"] = self._error_counts_by_category.get("rate_limit", 0) + 1
-            raise LokiRateLimitError(
-                "Rate limit exceeded. Please reduce request frequency."
-            )
-        elif response.status_code >= 400:
-            self._total_errors += 1
-            self._error_counts_by_category["query"] = self._error_counts_by_category.get("query", 0) + 1
-            error_msg = f"Loki API error: {response.status_code}"
-            try:
-                error_data = response.json()
-                if "error" in error_data:
-                    error_msg += f" - {error_data['error']}"
-            except Exception:
-                error_msg += f" - {response.text}"
-            
-            raise LokiQueryError(error_msg)
+        raise LokiQueryError(error_msg)
 
 
 
@@ -265,20 +361,20 @@ class LokiClient:
         Raises:
             LokiQueryError: When query fails
         """
-        params = {
-            "query": query,
-            "start": start,
-            "end": end,
-            "direction": direction
-        }
+        params = [
+            ("query", query),
+            ("start", start),
+            ("end", end),
+            ("direction", direction)
+        ]
         
         if limit is not None:
-            params["limit"] = limit
+            params.append(("limit", limit))
         if step is not None:
-            params["step"] = step
+            params.append(("step", step))
             
         logger.info("Executing range query", query=query, start=start, end=end)
-        return await self._make_request("GET", "/loki/api/v1/query_range", params=params)
+        return await self._make_request("GET", _QUERY_RANGE_PATH, params=params)
 
     async def query_instant(
         self,
@@ -301,18 +397,18 @@ class LokiClient:
         Raises:
             LokiQueryError: When query fails
         """
-        params = {
-            "query": query,
-            "direction": direction
-        }
+        params = [
+            ("query", query),
+            ("direction", direction)
+        ]
         
         if time is not None:
-            params["time"] = time
+            params.append(("time", time))
         if limit is not None:
-            params["limit"] = limit
+            params.append(("limit", limit))
             
         logger.info("Executing instant query", query=query, time=time)
-        return await self._make_request("GET", "/loki/api/v1/query", params=params)
+        return await self._make_request("GET", _QUERY_PATH, params=params)
 
     async def label_names(self, start: Optional[str] = None, end: Optional[str] = None) -> List[str]:
         """Get list of label names.
@@ -327,14 +423,14 @@ class LokiClient:
         Raises:
             LokiQueryError: When query fails
         """
-        params = {}
+        params = []
         if start is not None:
-            params["start"] = start
+            params.append(("start", start))
         if end is not None:
-            params["end"] = end
+            params.append(("end", end))
             
         logger.info("Fetching label names")
-        response = await self._make_request("GET", "/loki/api/v1/labels", params=params)
+        response = await self._make_request("GET", _LABELS_PATH, params=params)
         return response.get("data", [])
 
     async def label_values(
@@ -356,23 +452,23 @@ class LokiClient:
         Raises:
             LokiQueryError: When query fails
         """
-        params = {}
+        params = []
         if start is not None:
-            params["start"] = start
+            params.append(("start", start))
         if end is not None:
-            params["end"] = end
+            params.append(("end", end))
             
         logger.info("Fetching label values", label=label)
         response = await self._make_request(
             "GET", 
-            f"/loki/api/v1/label/{label}/values", 
+            _LABEL_VALUES_PATH.format(quote(label, safe='')),
             params=params
         )
         return response.get("data", [])
 
     async def series(
         self,
-        match: Union[str, List[str]],
+        match: Union[str, Sequence[str]],
         start: Optional[str] = None,
         end: Optional[str] = None
     ) -> List[Dict[str, str]]:
@@ -389,22 +485,74 @@ class LokiClient:
         Raises:
             LokiQueryError: When query fails
         """
-        params = {}
-        
         if isinstance(match, str):
-            params["match[]"] = match
+            params = [("match[]", match)]
         else:
-            params["match[]"] = match
+            params = [("match[]", selector) for selector in match]
             
         if start is not None:
-            params["start"] = start
+            params.append(("start", start))
         if end is not None:
-            params["end"] = end
+            params.append(("end", end))
             
         logger.info("Fetching series", match=match)
-        response = await self._make_request("GET", "/loki/api/v1/series", params=params)
+        response = await self._make_request("GET", _SERIES_PATH, params=params)
         return response.get("data", [])
 
+    async def label_values_many(
+        self,
+        labels: Sequence[str],
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> Dict[str, List[str]]:
+        """Get label values for several labels concurrently.
+        
+        Args:
+            labels: Label names
+            start: Start time for label query
+            end: End time for label query
+            
+        Returns:
+            Mapping of label name to its values
+            
+        Raises:
+            LokiQueryError: When any query fails
+        """
+        semaphore = self._concurrency()
+        
+        async def fetch(label: str) -> Tuple[str, List[str]]:
+            async with semaphore:
+                return label, await self.label_values(label, start, end)
+        
+        return dict(await asyncio.gather(*(fetch(label) for label in labels)))
+
+    async def series_many(
+        self,
+        matches: Sequence[Union[str, Sequence[str]]],
+        start: Optional[str] = None,
+        end: Optional[str] = None
+    ) -> List[List[Dict[str, str]]]:
+        """Get series for several label selectors concurrently.
+        
+        Args:
+            matches: Label selector(s) for each series query
+            start: Start time for series query
+            end: End time for series query
+            
+        Returns:
+            Series lists in the same order as ``matches``
+            
+        Raises:
+            LokiQueryError: When any query fails
+        """
+        semaphore = self._concurrency()
+        
+        async def fetch(match: Union[str, Sequence[str]]) -> List[Dict[str, str]]:
+            async with semaphore:
+                return await self.series(match, start, end)
+        
+        return list(await asyncio.gather(*(fetch(match) for match in matches)))
+
     def get_error_statistics(self) -> Dict[str, Any]:
         """Get error statistics for this client.
         
@@ -414,45 +562,10 @@ class LokiClient:
         return {
             "total_operations": self._total_operations,
             "total_errors": self._total_errors,
-            "error_counts_by_category": self._error_counts_by_category.copy(),
+            "error_counts_by_category": dict(self._error_counts_by_category),
             "operation_stats": {
                 "success_rate": (self._total_operations - self._total_errors) / max(self._total_operations, 1),
                 "error_rate": self._total_errors / max(self._total_operations, 1)
             }
         }
 
-
-class RateLimiter:
-    """Simple rate limiter for HTTP requests."""
-    
-    def __init__(self, max_requests: int, time_window: int):
-        """Initialize rate limiter.
-        
-        Args:
-            max_requests: Maximum requests allowed in time window
-            time_window: Time window in seconds
-        """
-        self.max_requests = max_requests
-        self.time_window = time_window
-        self.requests: List[float] = []
-        self._lock = asyncio.Lock()
-    
-    async def acquire(self) -> None:
-        """Acquire permission to make a request, waiting if necessary."""
-        async with self._lock:
-            now = time.time()
-            
-            # Remove old requests outside the time window
-            self.requests = [req_time for req_time in self.requests 
-                           if now - req_time < self.time_window]
-            
-            # If we're at the limit, wait until we can make another request
-            if len(self.requests) >= self.max_requests:
-                oldest_request = min(self.requests)
-                wait_time = self.time_window - (now - oldest_request)
-                if wait_time > 0:
-                    logger.debug("Rate limit reached, waiting", wait_time=wait_time)
-                    await asyncio.sleep(wait_time)
-            
-            # Record this request
-            self.requests.append(now)
\ No newline at end of file
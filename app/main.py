@@ -14,19 +14,38 @@ try:
 except ImportError:
     from .logging_config import setup_default_logging
 
+logger = structlog.get_logger(__name__)
+
+# Upper bound on the startup health check so an unreachable Loki cannot stall
+# server startup
+_STARTUP_VALIDATION_TIMEOUT = 5.0
+
 
 class GracefulShutdown:
     """Handle graceful shutdown of the server."""
     
-    def __init__(self):
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
         self.shutdown_event = asyncio.Event()
-        self._setup_signal_handlers()
+        self._setup_signal_handlers(loop)
     
-    def _setup_signal_handlers(self):
+    def _setup_signal_handlers(self, loop: Optional[asyncio.AbstractEventLoop] = None):
         """Set up signal handlers for graceful shutdown."""
+        if loop is None:
+            try:
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                loop = None
+        
         if sys.platform != "win32":
-            # Unix-like systems
+            # Unix-like systems: let the event loop deliver signals through its
+            # wakeup fd so the event is set from loop context
             for sig in (signal.SIGTERM, signal.SIGINT):
+                if loop is not None:
+                    try:
+                        loop.add_signal_handler(sig, self._signal_handler, sig, None)
+                        continue
+                    except (NotImplementedError, RuntimeError):
+                        pass
                 signal.signal(sig, self._signal_handler)
         else:
             # Windows
@@ -34,7 +53,6 @@ class GracefulShutdown:
     
     def _signal_handler(self, signum, frame):
         """Handle shutdown signals."""
-        logger = structlog.get_logger(__name__)
         logger.info("Shutdown signal received", signal=signum)
         self.shutdown_event.set()
     
@@ -43,27 +61,30 @@ class GracefulShutdown:
         await self.shutdown_event.wait()
 
 
-async def validate_startup(config) -> bool:
+async def validate_startup(config, client=None) -> bool:
     """
     Validate server startup conditions and perform health checks.
     
     Args:
         config: Loki configuration
+        client: Optional LokiClient to probe with. A shared client is left
+            open so the server can reuse its warm connection.
         
     Returns:
         True if validation passes, False otherwise
     """
-    logger = structlog.get_logger(__name__)
     logger.info("Performing startup validation")
     
     try:
         # Test Loki connectivity
-        try:
-            from app.loki_client import LokiClient
-        except ImportError:
-            from .loki_client import LokiClient
-        
-        client = LokiClient(config)
+        owns_client = client is None
+        if owns_client:
+            try:
+                from app.loki_client import LokiClient
+            except ImportError:
+                from .loki_client import LokiClient
+            
+            client = LokiClient(config)
         
         # Perform a simple health check query
         logger.info("Testing Loki connectivity", loki_url=config.url)
@@ -80,6 +101,9 @@ async def validate_startup(config) -> bool:
             )
             # Don't fail startup for connectivity issues - allow server to start
             # and handle connection errors at runtime
+        finally:
+            if owns_client:
+                await client.close()
         
         logger.info("Startup validation completed successfully")
         return True
@@ -147,10 +171,16 @@ Examples:
     return parser.parse_args()
 
 
-async def main() -> None:
-    """Main entry point for the Loki MCP server."""
+async def main(args: Optional[argparse.Namespace] = None) -> None:
+    """
+    Main entry point for the Loki MCP server.
+    
+    Args:
+        args: Parsed command-line arguments. Parsed from sys.argv if omitted.
+    """
     # Parse command-line arguments
-    args = parse_arguments()
+    if args is None:
+        args = parse_arguments()
     
     # Set environment variable for stdio mode detection
     if args.transport == 'stdio':
@@ -158,7 +188,6 @@ async def main() -> None:
     
     # Set up logging with specified level
     setup_default_logging(level=args.log_level)
-    logger = structlog.get_logger(__name__)
     
     logger.info(
         "Starting Loki MCP Server",
@@ -167,13 +196,17 @@ async def main() -> None:
         log_level=args.log_level
     )
     
+    # Created once the configuration is loaded; closed on every exit path
+    client = None
     try:
         try:
             from app.server import create_server
             from app.config import load_config, ConfigurationError
+            from app.loki_client import LokiClient
         except ImportError:
             from .server import create_server
             from .config import load_config, ConfigurationError
+            from .loki_client import LokiClient
         
         # Load and validate configuration
         try:
@@ -189,8 +222,34 @@ async def main() -> None:
             logger.error("Configuration error", error=str(e))
             sys.exit(1)
         
-        # Perform startup validation and health checks
-        if not await validate_startup(config):
+        # One client serves the health check and all tool calls, so the
+        # connection opened by the probe stays warm for the first query
+        client = LokiClient(config)
+        
+        # Perform startup validation and health checks, overlapping the
+        # bounded health probe with server construction
+        validation = asyncio.wait_for(
+            validate_startup(config, client=client), timeout=_STARTUP_VALIDATION_TIMEOUT
+        )
+        if args.validate_only:
+            results = await asyncio.gather(validation, return_exceptions=True)
+        else:
+            results = await asyncio.gather(
+                validation, create_server(config, client=client), return_exceptions=True
+            )
+        valid = results[0]
+        
+        if isinstance(valid, asyncio.TimeoutError):
+            logger.warning(
+                "Startup validation timed out - server will start but may not function properly",
+                timeout=_STARTUP_VALIDATION_TIMEOUT,
+                suggestion="Verify LOKI_URL and network connectivity"
+            )
+            valid = True
+        elif isinstance(valid, BaseException):
+            raise valid
+        
+        if not valid:
             logger.error("Startup validation failed")
             sys.exit(1)
         
@@ -199,40 +258,37 @@ async def main() -> None:
             logger.info("Configuration and connectivity validation completed successfully")
             sys.exit(0)
         
-        # Set up graceful shutdown handling
-        shutdown_handler = GracefulShutdown()
-        
-        # Create server
-        server = await create_server(config)
+        server = results[1]
+        if isinstance(server, BaseException):
+            raise server
         logger.info("Server created successfully")
         
-        # Run server with graceful shutdown
-        server_task = asyncio.create_task(server.run(args.transport))
-        shutdown_task = asyncio.create_task(shutdown_handler.wait_for_shutdown())
+        # Set up graceful shutdown handling
+        loop = asyncio.get_running_loop()
+        shutdown_handler = GracefulShutdown(loop)
         
-        logger.info("Server started successfully", transport=args.transport)
+        # Run server with graceful shutdown; the server finishing on its own
+        # releases the same wait as a shutdown signal
+        transport = args.transport
+        server_task = asyncio.create_task(server.run(transport))
+        server_task.add_done_callback(lambda _: shutdown_handler.shutdown_event.set())
         
-        # Wait for either server completion or shutdown signal
-        done, pending = await asyncio.wait(
-            [server_task, shutdown_task],
-            return_when=asyncio.FIRST_COMPLETED
-        )
+        logger.info("Server started successfully", transport=transport)
         
-        # Cancel pending tasks
-        for task in pending:
-            task.cancel()
-            try:
-                await task
-            except asyncio.CancelledError:
-                pass
+        # Wait for either server completion or shutdown signal
+        await shutdown_handler.wait_for_shutdown()
         
-        # Check if server task completed with an exception
-        if server_task in done:
-            try:
-                await server_task
-            except Exception as e:
-                logger.error("Server task failed", error=str(e))
-                raise
+        # Single teardown path: cancel the server if it is still running and
+        # surface any exception it finished with
+        if not server_task.done():
+            server_task.cancel()
+        try:
+            await server_task
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.error("Server task failed", error=str(e))
+            raise
         
         logger.info("Server shutdown completed")
         
@@ -244,12 +300,19 @@ async def main() -> None:
     except Exception as e:
         logger.error("Server failed to start", error=str(e))
         sys.exit(1)
+    finally:
+        if client is not None:
+            await client.close()
 
 
 def cli_main() -> None:
     """CLI entry point that handles asyncio setup."""
+    # Parse before starting the event loop so --help and --version exit
+    # without creating one
+    args = parse_arguments()
+    
     try:
-        asyncio.run(main())
+        asyncio.run(main(args))
     except KeyboardInterrupt:
         # Handle KeyboardInterrupt at the top level to avoid stack trace
         pass
@@ -1,16 +1,84 @@
 """LogQL query construction utilities."""
 
 import re
-from typing import Dict, List, Optional, Union
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime, timezone
 
+# Valid Loki/Prometheus label name, checked in strict mode
+_LABEL_KEY_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+# Relative time such as "5m", "1h" or "2d"
+_RELATIVE_RE = re.compile(r'^\d+[smhdw]$')
+
+# Accepted ISO 8601 layouts, checked before fromisoformat, which accepts
+# more layouts on newer Python versions
+_ISO_RE = re.compile(
+    r'^\d{4}-\d{2}-\d{2}'
+    r'(?:T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})?| \d{2}:\d{2}:\d{2})$'
+)
+
+# Selector used when no labels are given. It matches any stream with at least
+# one label, which avoids Loki's "empty-compatible value" error.
+_EMPTY_SELECTOR = '{__name__=~".+"}'
+
+# Line filter pieces for keyword searches
+_CS_FILTER_PREFIX = '|~ "'
+_CI_FILTER_PREFIX = '|~ "(?i)'
+_FILTER_SUFFIX = '"'
+
+# Keywords made only of these characters need no regex escaping beyond the
+# hyphen and space, which re.escape would also backslash-escape
+_SAFE_KW_RE = re.compile(r'[A-Za-z0-9_\- ]+')
+
+
+def _escape_keyword(keyword: str) -> str:
+    """Escape a keyword for a regex line filter, skipping re.escape for plain words."""
+    if _SAFE_KW_RE.fullmatch(keyword):
+        return keyword.replace('-', '\\-').replace(' ', '\\ ')
+    return re.escape(keyword)
+
+
+@lru_cache(maxsize=256)
+def _build_label_selector_impl(items: Tuple[Tuple[str, str], ...]) -> str:
+    """Build a label selector from label items, memoized for repeated label sets."""
+    label_parts = []
+    for key, value in items:
+        if not key:
+            raise ValueError(f"Invalid label key: {key}")
+        
+        # Use regex matching to avoid empty-compatible values
+        if value == ".*" or value == "":
+            # For wildcard or empty values, use a non-empty regex
+            label_parts.append(key + '=~".+"')
+        else:
+            # For specific values, use exact match; escape quotes only if present
+            if '"' in value:
+                value = value.replace('"', '\\"')
+            label_parts.append(key + '="' + value + '"')
+    
+    return "{" + ", ".join(label_parts) + "}"
+
+
+@lru_cache(maxsize=512)
+def _validated_pattern(pattern: str) -> str:
+    """Return the pattern once it is known to compile; raises re.error otherwise."""
+    re.compile(pattern)
+    return pattern
+
 
 class LogQLQueryBuilder:
     """Builder class for constructing LogQL queries from user inputs."""
     
-    def __init__(self):
-        """Initialize the query builder."""
-        pass
+    def __init__(self, strict: bool = False):
+        """
+        Initialize the query builder.
+        
+        Args:
+            strict: Whether to validate every label up front, including label
+                name syntax, before building selectors
+        """
+        self.strict = strict
     
     def build_search_query(
         self, 
@@ -33,21 +101,15 @@ class LogQLQueryBuilder:
             raise ValueError("At least one keyword must be provided")
         
         # Start with label selector
-        label_selector = self._build_label_selector(labels or {})
+        label_selector = self._build_label_selector(labels) if labels else _EMPTY_SELECTOR
         
-        # Build keyword filters
-        keyword_filters = []
-        for keyword in keywords:
-            if not keyword.strip():
-                continue
-            
-            # Escape special regex characters in keywords
-            escaped_keyword = re.escape(keyword.strip())
-            
-            if case_sensitive:
-                keyword_filters.append(f'|~ "{escaped_keyword}"')
-            else:
-                keyword_filters.append(f'|~ "(?i){escaped_keyword}"')
+        # Build keyword filters, escaping special regex characters in keywords
+        prefix = _CS_FILTER_PREFIX if case_sensitive else _CI_FILTER_PREFIX
+        keyword_filters = [
+            prefix + _escape_keyword(keyword) + _FILTER_SUFFIX
+            for keyword in (k.strip() for k in keywords)
+            if keyword
+        ]
         
         if not keyword_filters:
             raise ValueError("No valid keywords provided")
@@ -78,13 +140,13 @@ class LogQLQueryBuilder:
             raise ValueError("Pattern cannot be empty")
         
         # Start with label selector
-        label_selector = self._build_label_selector(labels or {})
+        label_selector = self._build_label_selector(labels) if labels else _EMPTY_SELECTOR
         
         # Build pattern filter
         if use_regex:
             # Validate regex pattern
             try:
-                re.compile(pattern)
+                _validated_pattern(pattern)
             except re.error as e:
                 raise ValueError(f"Invalid regex pattern: {e}")
             
@@ -160,29 +222,36 @@ class LogQLQueryBuilder:
             Label selector string
         """
         if not labels:
-            # Return a selector that matches any stream with at least one label
-            # This avoids the "empty-compatible value" error
-            return '{__name__=~".+"}'
+            return _EMPTY_SELECTOR
+        
+        if self.strict:
+            self._validate_labels(labels)
+        
+        try:
+            return _build_label_selector_impl(tuple(labels.items()))
+        except TypeError:
+            # A non-string or unhashable key or value; report it as a
+            # validation error
+            self._validate_labels(labels)
+            raise
+    
+    def _validate_labels(self, labels: Dict[str, str]) -> None:
+        """
+        Validate label keys and values.
         
-        label_parts = []
+        Args:
+            labels: Label filters as key-value pairs
+            
+        Raises:
+            ValueError: If a label key or value is invalid
+        """
         for key, value in labels.items():
             if not key or not isinstance(key, str):
                 raise ValueError(f"Invalid label key: {key}")
+            if self.strict and not _LABEL_KEY_RE.fullmatch(key):
+                raise ValueError(f"Invalid label key: {key}")
             if not isinstance(value, str):
                 raise ValueError(f"Invalid label value for key '{key}': {value}")
-            
-            # Escape quotes in values
-            escaped_value = value.replace('"', '\\"')
-            
-            # Use regex matching to avoid empty-compatible values
-            if value == ".*" or value == "":
-                # For wildcard or empty values, use a non-empty regex
-                label_parts.append(f'{key}=~".+"')
-            else:
-                # For specific values, use exact match
-                label_parts.append(f'{key}="{escaped_value}"')
-        
-        return "{" + ", ".join(label_parts) + "}"
     
     def _validate_time_format(self, time_str: str) -> None:
         """
@@ -194,55 +263,44 @@ class LogQLQueryBuilder:
         Raises:
             ValueError: If time format is invalid
         """
-        if not time_str or not time_str.strip():
+        time_str = time_str.strip() if time_str else ''
+        if not time_str:
             raise ValueError("Time string cannot be empty")
         
-        time_str = time_str.strip()
-        
         # Check for relative time formats (e.g., "5m", "1h", "2d")
-        relative_pattern = r'^\d+[smhdw]$'
-        if re.match(relative_pattern, time_str):
+        if _RELATIVE_RE.match(time_str):
             return
         
-        # Check for Unix timestamp (seconds or milliseconds)
-        if time_str.isdigit():
+        # Check for Unix timestamp; milliseconds are detected by magnitude.
+        # Only ASCII digits, as int() also takes signs, underscores and
+        # other Unicode digits
+        if time_str.isascii() and time_str.isdigit():
             timestamp = int(time_str)
+            if timestamp >= 946684800000:
+                timestamp //= 1000
             # Reasonable timestamp range check (year 2000 to 2100)
-            if 946684800 <= timestamp <= 4102444800 or 946684800000 <= timestamp <= 4102444800000:
+            if 946684800 <= timestamp <= 4102444800:
                 return
         
-        # Check for ISO format patterns
-        iso_patterns = [
-            r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z?$',
-            r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?[+-]\d{2}:\d{2}$',
-            r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$'
-        ]
-        
-        # Check if it matches ISO pattern and try to parse basic date components
-        for pattern in iso_patterns:
-            if re.match(pattern, time_str):
-                # Basic validation of date components for ISO format
-                try:
-                    # Extract date part for basic validation
-                    date_part = time_str.split('T')[0] if 'T' in time_str else time_str.split(' ')[0]
-                    year, month, day = map(int, date_part.split('-'))
-                    
-                    # Basic range checks
-                    if not (1 <= month <= 12):
-                        raise ValueError(f"Invalid month: {month}")
-                    if not (1 <= day <= 31):
-                        raise ValueError(f"Invalid day: {day}")
-                    if not (1900 <= year <= 2200):
-                        raise ValueError(f"Invalid year: {year}")
-                    
+        # Check for ISO 8601; fromisoformat rejects invalid dates on its own
+        if _ISO_RE.match(time_str):
+            try:
+                iso_str = time_str[:-1] if time_str.endswith('Z') else time_str
+                parsed = datetime.fromisoformat(iso_str.replace(' ', 'T'))
+            except ValueError:
+                pass
+            else:
+                if 1900 <= parsed.year <= 2200:
                     return
-                except (ValueError, IndexError):
-                    # If parsing fails, continue to the error case
-                    pass
         
         raise ValueError(f"Invalid time format: {time_str}. Expected ISO format, Unix timestamp, or relative time (e.g., '5m', '1h')")
 
 
+# Shared builder for the convenience functions; the builder holds no mutable
+# state, so one instance serves all callers
+_DEFAULT_BUILDER = LogQLQueryBuilder()
+
+
 # Convenience functions for common use cases
 def search_logs(keywords: List[str], labels: Optional[Dict[str, str]] = None) -> str:
     """
@@ -255,8 +313,7 @@ def search_logs(keywords: List[str], labels: Optional[Dict[str, str]] = None) ->
     Returns:
         LogQL query string
     """
-    builder = LogQLQueryBuilder()
-    return builder.build_search_query(keywords, labels)
+    return _DEFAULT_BUILDER.build_search_query(keywords, labels)
 
 
 def search_pattern(pattern: str, labels: Optional[Dict[str, str]] = None) -> str:
@@ -270,5 +327,4 @@ def search_pattern(pattern: str, labels: Optional[Dict[str, str]] = None) -> str
     Returns:
         LogQL query string
     """
-    builder = LogQLQueryBuilder()
-    return builder.build_pattern_query(pattern, labels)
\ No newline at end of file
+    return _DEFAULT_BUILDER.build_pattern_query(pattern, labels)
\ No newline at end of file
@@ -1,36 +1,120 @@
 """Main MCP server implementation."""
 
 import asyncio
-from typing import Any, Dict, List, Optional, Sequence
+import gc
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union, get_args, get_origin
 
 import structlog
 from mcp import types
 from mcp.server import Server, NotificationOptions
 from mcp.server.models import InitializationOptions
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 
 from .config import LokiConfig, ConfigurationError
+from .loki_client import LokiClient
 from .tools.query_logs import query_logs_tool, create_query_logs_tool, QueryLogsParams
 from .tools.search_logs import search_logs_tool, create_search_logs_tool, SearchLogsParams
 from .tools.get_labels import get_labels_tool, create_get_labels_tool, GetLabelsParams
-from .error_handler import ErrorClassifier, ErrorContext, ErrorCategory
+from .tools.batch_execute import create_batch_execute_tool, BatchExecuteParams, BatchExecuteResult
+from .error_handler import (
+    ErrorClassifier,
+    ErrorContext,
+    ErrorCategory,
+    ErrorInfo,
+    ErrorSeverity,
+    VALIDATION_ERROR_MESSAGE,
+    VALIDATION_ERROR_SUGGESTION,
+)
 
 logger = structlog.get_logger(__name__)
 
+# Field types model_construct can take unchanged from a trusted caller
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
+
+def _constructible_fields(model: Type[BaseModel]) -> Optional[Dict[str, Tuple[type, ...]]]:
+    """
+    Map the fields of a flat parameter model to the value types it accepts as-is.
+    
+    Args:
+        model: Parameter model class
+        
+    Returns:
+        Field name to accepted types, or None when the model has validators,
+        constrained fields or non-scalar fields, whose checks, coercion and
+        nested construction model_construct would skip
+    """
+    decorators = model.__pydantic_decorators__
+    if decorators.field_validators or decorators.model_validators:
+        return None
+    
+    fields = {}
+    for name, field in model.model_fields.items():
+        annotation = field.annotation
+        types_ = get_args(annotation) if get_origin(annotation) is Union else (annotation,)
+        if field.metadata or not all(t in _SCALAR_TYPES for t in types_):
+            return None
+        fields[name] = types_
+    return fields
+
+
+# Parameter models that trusted arguments may build without validation
+_CONSTRUCTIBLE_PARAMS = {
+    model: fields
+    for model, fields in (
+        (model, _constructible_fields(model))
+        for model in (QueryLogsParams, SearchLogsParams, GetLabelsParams)
+    )
+    if fields is not None
+}
+
 
 class LokiMCPServer:
     """Main MCP server for Loki integration."""
     
-    def __init__(self, config: LokiConfig):
+    def __init__(self, config: LokiConfig, client: Optional[LokiClient] = None):
         """
         Initialize the Loki MCP server.
         
         Args:
             config: Loki configuration
+            client: Optional LokiClient shared by all tool calls. Without
+                one, the server creates its own and closes it on shutdown.
         """
         self.config = config
+        # Tool calls always share one client, so its connection pool and
+        # rate-limit state outlive individual calls
+        self._owns_client = client is None
+        self.client = client if client is not None else LokiClient(config)
         self.server = Server("loki-mcp-server")
+        # Tool metadata is static, so the MCP tool list is built only once
+        self._cached_tools = tuple(
+            types.Tool(
+                name=tool.name,
+                description=tool.description,
+                inputSchema=tool.inputSchema
+            )
+            for tool in (
+                create_query_logs_tool(),
+                create_search_logs_tool(),
+                create_get_labels_tool(),
+                create_batch_execute_tool()
+            )
+        )
+        # Trusted deployments skip Pydantic validation of flat tool arguments
+        self._trust_arguments = config.trust_arguments
+        # Tool name -> bound handler, resolved once
+        self._dispatch = {
+            "query_logs": self._handle_query_logs,
+            "search_logs": self._handle_search_logs,
+            "get_labels": self._handle_get_labels,
+            "batch_execute": self._handle_batch_execute,
+        }
         self._setup_handlers()
+        # Startup objects (modules, tool schemas, the client) live as long as
+        # the server; freezing them keeps full collections from rescanning
+        # them while tool calls are in flight
+        gc.freeze()
         
         logger.info("Loki MCP Server initialized", loki_url=config.url)
     
@@ -40,23 +124,7 @@ class LokiMCPServer:
         @self.server.list_tools()
         async def handle_list_tools() -> List[types.Tool]:
             """Handle tool discovery requests."""
-            logger.debug("Listing available tools")
-            
-            tools = [
-                create_query_logs_tool(),
-                create_search_logs_tool(),
-                create_get_labels_tool()
-            ]
-            
-            # Convert to MCP types.Tool format
-            mcp_tools = []
-            for tool in tools:
-                mcp_tool = types.Tool(
-                    name=tool.name,
-                    description=tool.description,
-                    inputSchema=tool.inputSchema
-                )
-                mcp_tools.append(mcp_tool)
+            mcp_tools = list(self._cached_tools)
             
             logger.info("Tools listed", tool_count=len(mcp_tools))
             return mcp_tools
@@ -76,20 +144,19 @@ class LokiMCPServer:
             Returns:
                 Tool execution results
             """
-            logger.info("Tool called", tool_name=name, arguments=arguments)
-            
             if arguments is None:
                 arguments = {}
             
+            # Only the argument count at info; rendering the full arguments
+            # (long queries, label maps) is left to debug, which the
+            # filtering logger drops without formatting
+            logger.info("Tool called", tool_name=name, argc=len(arguments))
+            logger.debug("Tool arguments", tool_name=name, arguments=arguments)
+            
             try:
                 # Route to appropriate tool handler
-                if name == "query_logs":
-                    result = await self._handle_query_logs(arguments)
-                elif name == "search_logs":
-                    result = await self._handle_search_logs(arguments)
-                elif name == "get_labels":
-                    result = await self._handle_get_labels(arguments)
-                else:
+                handler = self._dispatch.get(name)
+                if handler is None:
                     error_msg = f"Unknown tool: {name}"
                     logger.error("Unknown tool requested", tool_name=name)
                     return [types.TextContent(
@@ -97,6 +164,8 @@ class LokiMCPServer:
                         text=f"Error: {error_msg}"
                     )]
                 
+                result = await handler(arguments)
+                
                 # Format successful result
                 return [types.TextContent(
                     type="text",
@@ -104,9 +173,23 @@ class LokiMCPServer:
                 )]
                 
             except ValidationError as e:
-                error_info = ErrorClassifier.classify_error(e)
+                # Validation errors always classify the same way; build the
+                # message from the first few errors without the classifier
+                details = "; ".join(
+                    f"{'.'.join(map(str, err['loc']))}: {err['msg']}"
+                    for err in e.errors()[:3]
+                )
+                error_info = ErrorInfo(
+                    category=ErrorCategory.VALIDATION,
+                    severity=ErrorSeverity.MEDIUM,
+                    message=VALIDATION_ERROR_MESSAGE,
+                    suggestion=VALIDATION_ERROR_SUGGESTION,
+                    details=details,
+                    should_retry=False,
+                    user_actionable=True
+                )
                 error_msg = self._format_error_message(error_info, name, arguments)
-                logger.error("Parameter validation failed", tool_name=name, error=str(e))
+                logger.error("Parameter validation failed", tool_name=name, error=details)
                 return [types.TextContent(
                     type="text",
                     text=error_msg
@@ -120,47 +203,117 @@ class LokiMCPServer:
                     text=error_msg
                 )]
     
+    def _build_params(self, model: Type[BaseModel], arguments: Dict[str, Any]) -> BaseModel:
+        """
+        Build tool parameters, skipping validation only where it is safe.
+        
+        Trusted arguments are used as-is when the model is flat and every
+        value already has its field's type; anything else is validated.
+        
+        Args:
+            model: Parameter model class
+            arguments: Tool arguments
+            
+        Returns:
+            Parameter model instance
+        """
+        if self._trust_arguments:
+            fields = _CONSTRUCTIBLE_PARAMS.get(model)
+            if fields is not None and all(
+                name in fields and type(value) in fields[name]
+                for name, value in arguments.items()
+            ):
+                return model.model_construct(**arguments)
+        return model(**arguments)
+    
     async def _handle_query_logs(self, arguments: Dict[str, Any]) -> Any:
         """Handle query_logs tool execution."""
-        try:
-            params = QueryLogsParams(**arguments)
-            result = await query_logs_tool(params, self.config)
-            logger.info("Query logs completed", status=result.status, entries=result.total_entries)
-            return result
-        except ValidationError as e:
-            logger.error("Query logs parameter validation failed", error=str(e))
-            raise
-        except Exception as e:
-            logger.error("Query logs execution failed", error=str(e))
-            raise
+        params = self._build_params(QueryLogsParams, arguments)
+        result = await query_logs_tool(params, self.config, self.client)
+        logger.info("Query logs completed", status=result.status, entries=result.total_entries)
+        return result
     
     async def _handle_search_logs(self, arguments: Dict[str, Any]) -> Any:
         """Handle search_logs tool execution."""
-        try:
-            params = SearchLogsParams(**arguments)
-            result = await search_logs_tool(params, self.config)
-            logger.info("Search logs completed", status=result.status, entries=result.total_entries)
-            return result
-        except ValidationError as e:
-            logger.error("Search logs parameter validation failed", error=str(e))
-            raise
-        except Exception as e:
-            logger.error("Search logs execution failed", error=str(e))
-            raise
+        params = self._build_params(SearchLogsParams, arguments)
+        result = await search_logs_tool(params, self.config, self.client)
+        logger.info("Search logs completed", status=result.status, entries=result.total_entries)
+        return result
     
     async def _handle_get_labels(self, arguments: Dict[str, Any]) -> Any:
         """Handle get_labels tool execution."""
-        try:
-            params = GetLabelsParams(**arguments)
-            result = await get_labels_tool(params, self.config)
-            logger.info("Get labels completed", status=result.status, labels=result.total_count)
-            return result
-        except ValidationError as e:
-            logger.error("Get labels parameter validation failed", error=str(e))
-            raise
-        except Exception as e:
-            logger.error("Get labels execution failed", error=str(e))
-            raise
+        params = self._build_params(GetLabelsParams, arguments)
+        result = await get_labels_tool(params, self.config, self.client)
+        logger.info("Get labels completed", status=result.status, labels=result.total_count)
+        return result
+    
+    async def _handle_batch_execute(self, arguments: Dict[str, Any]) -> Any:
+        """Handle batch_execute tool execution."""
+        # Always validated, even for trusted callers: model_construct would
+        # leave the nested operations as plain dicts
+        params = BatchExecuteParams(**arguments)
+        operations = params.operations
+        semaphore = asyncio.Semaphore(params.max_concurrent)
+        
+        async def run_operation(operation):
+            # Batches cannot nest; only the single-call tools are dispatched
+            handler = self._dispatch.get(operation.name)
+            if handler is None or operation.name == "batch_execute":
+                raise ValueError(f"Unknown tool: {operation.name}")
+            async with semaphore:
+                return await handler(operation.arguments)
+        
+        tasks = [asyncio.ensure_future(run_operation(operation)) for operation in operations]
+        
+        if params.stop_on_error:
+            # Cancel whatever is still pending once any call fails, or if
+            # this call is itself cancelled while waiting
+            try:
+                for next_done in asyncio.as_completed(tasks):
+                    try:
+                        result = await next_done
+                    except Exception:
+                        break
+                    if getattr(result, "status", None) == "error":
+                        break
+            finally:
+                for task in tasks:
+                    if not task.done():
+                        task.cancel()
+        
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        results = []
+        failed = 0
+        for operation, outcome in zip(operations, outcomes):
+            if isinstance(outcome, asyncio.CancelledError):
+                failed += 1
+                results.append({"name": operation.name, "status": "cancelled"})
+            elif isinstance(outcome, Exception):
+                failed += 1
+                error_info = ErrorClassifier.classify_error(outcome)
+                results.append({
+                    "name": operation.name,
+                    "status": "error",
+                    "error": self._format_error_message(error_info, operation.name, operation.arguments)
+                })
+            else:
+                status = getattr(outcome, "status", "success")
+                if status == "error":
+                    failed += 1
+                results.append({
+                    "name": operation.name,
+                    "status": status,
+                    "output": self._format_tool_result(outcome)
+                })
+        
+        logger.info("Batch execute completed", operations=len(results), failed=failed)
+        return BatchExecuteResult(
+            status="success" if failed == 0 else "partial",
+            operations=results,
+            total_operations=len(results),
+            failed=failed
+        )
     
     def _format_error_message(
         self, 
@@ -224,8 +377,11 @@ class LokiMCPServer:
             Formatted result string
         """
         try:
-            # Convert result to dict if it's a Pydantic model
-            if hasattr(result, 'model_dump'):
+            # Read a Pydantic model's fields in place; model_dump() would
+            # deep-copy every log entry just to format the first few
+            if isinstance(result, BaseModel):
+                result_dict = result.__dict__
+            elif hasattr(result, 'model_dump'):
                 result_dict = result.model_dump()
             else:
                 result_dict = result
@@ -243,20 +399,13 @@ class LokiMCPServer:
                 if total == 0:
                     return "No log entries found matching the criteria."
                 
-                # Format entries for display
-                formatted_entries = []
-                for entry in entries[:10]:  # Limit display to first 10 entries
-                    timestamp = entry.get("timestamp", "Unknown time")
-                    line = entry.get("line", "")
-                    labels = entry.get("labels", {})
-                    
-                    # Format labels for display
-                    label_str = ", ".join([f"{k}={v}" for k, v in labels.items()])
-                    
-                    formatted_entry = f"[{timestamp}] {label_str}: {line}"
-                    formatted_entries.append(formatted_entry)
-                
-                result_text = f"Found {total} log entries:\n\n" + "\n".join(formatted_entries)
+                # Format entries for display, limited to the first 10 entries
+                result_text = f"Found {total} log entries:\n\n" + "\n".join(
+                    f"[{entry.get('timestamp', 'Unknown time')}] "
+                    f"{', '.join(f'{k}={v}' for k, v in entry.get('labels', {}).items())}: "
+                    f"{entry.get('line', '')}"
+                    for entry in entries[:10]
+                )
                 
                 if total > 10:
                     result_text += f"\n\n... and {total - 10} more entries"
@@ -282,14 +431,25 @@ class LokiMCPServer:
                     result_text = f"Found {total} label names:\n\n"
                 
                 # Display labels (limit to first 50)
-                display_labels = labels[:50]
-                result_text += "\n".join(display_labels)
+                result_text += "\n".join(labels[:50])
                 
                 if total > 50:
                     result_text += f"\n\n... and {total - 50} more {label_type}"
                 
                 return result_text
             
+            elif "operations" in result_dict:
+                # Batch results
+                operations = result_dict["operations"]
+                total = result_dict["total_operations"]
+                failed = result_dict["failed"]
+                
+                return f"Executed {total} operations ({failed} failed):\n\n" + "\n\n".join(
+                    f"[{index}] {operation['name']} ({operation['status']}):\n"
+                    f"{operation.get('output') or operation.get('error', '')}"
+                    for index, operation in enumerate(operations, 1)
+                )
+            
             else:
                 # Generic result formatting
                 return str(result_dict)
@@ -329,14 +489,25 @@ class LokiMCPServer:
         except Exception as e:
             logger.error("Server run failed", error=str(e))
             raise
+        finally:
+            await self.close()
+    
+    async def close(self) -> None:
+        """Close the LokiClient if the server created it."""
+        if self._owns_client:
+            await self.client.close()
 
 
-async def create_server(config: Optional[LokiConfig] = None) -> LokiMCPServer:
+async def create_server(
+    config: Optional[LokiConfig] = None,
+    client: Optional[LokiClient] = None
+) -> LokiMCPServer:
     """
     Create and configure a Loki MCP server.
     
     Args:
         config: Optional Loki configuration. If not provided, loads from environment.
+        client: Optional LokiClient to share across tool calls
         
     Returns:
         Configured LokiMCPServer instance
@@ -348,6 +519,6 @@ async def create_server(config: Optional[LokiConfig] = None) -> LokiMCPServer:
         from .config import load_config
         config = load_config()
     
-    server = LokiMCPServer(config)
+    server = LokiMCPServer(config, client)
     logger.info("Loki MCP server created successfully")
     return server
\ No newline at end of file
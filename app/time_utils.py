@@ -1,9 +1,88 @@
 """Time utilities for Loki queries."""
 
 import re
+import time
 from datetime import datetime, timezone, timedelta
+from functools import lru_cache
 from typing import Optional, Union
 
+# Relative time such as "5m" or "now-1h"
+_REL_RE = re.compile(r'^(?:now-)?(\d+)([smhdw])$')
+
+# Seconds per relative time unit
+_UNIT_SECONDS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+
+# Accepted ISO 8601 layouts: "T"-separated with optional fraction and zone,
+# or space-separated without either. Checked before fromisoformat, which
+# accepts more layouts on newer Python versions.
+_ISO_RE = re.compile(
+    r'^\d{4}-\d{2}-\d{2}'
+    r'(?:T\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:\d{2})?| \d{2}:\d{2}:\d{2})$'
+)
+
+
+def _compute_relative(amount: int, unit_seconds: int, now_ts: float) -> float:
+    """Return the epoch timestamp ``amount`` units of ``unit_seconds`` before ``now_ts``."""
+    return now_ts - amount * unit_seconds
+
+
+def _rfc3339(dt: datetime) -> str:
+    """Format an aware UTC datetime as RFC3339 with a "Z" suffix."""
+    # isoformat() of a UTC datetime always ends in "+00:00"
+    return dt.isoformat()[:-6] + 'Z'
+
+
+@lru_cache(maxsize=1024)
+def _absolute_to_loki_time(time_str: str) -> str:
+    """
+    Convert a Unix timestamp or ISO time string to RFC3339.
+    
+    Absolute times always convert to the same value, so results are cached.
+    
+    Args:
+        time_str: Stripped, non-empty time string
+        
+    Returns:
+        RFC3339 formatted time string
+        
+    Raises:
+        ValueError: If time format is invalid
+    """
+    # Handle Unix timestamp (seconds or milliseconds)
+    if time_str.isdigit():
+        timestamp = int(time_str)
+        
+        # Detect if it's milliseconds (rough heuristic: > year 2020 in seconds)
+        if timestamp > 1577836800000:  # 2020-01-01 in milliseconds
+            timestamp = timestamp / 1000
+        
+        # Validate timestamp range (year 2000 to 2100)
+        if not (946684800 <= timestamp <= 4102444800):
+            raise ValueError(f"Timestamp out of reasonable range: {timestamp}")
+        
+        dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+        return _rfc3339(dt)
+    
+    # Handle ISO format
+    if _ISO_RE.match(time_str):
+        try:
+            dt = datetime.fromisoformat(
+                time_str[:-1] + '+00:00' if time_str.endswith('Z') else time_str
+            )
+        except ValueError as e:
+            raise ValueError(f"Invalid datetime format: {time_str} - {e}")
+        
+        # Convert to UTC and return in RFC3339 format
+        if dt.tzinfo is None:
+            # Assume UTC if no timezone info
+            dt = dt.replace(tzinfo=timezone.utc)
+        else:
+            dt = dt.astimezone(timezone.utc)
+        
+        return _rfc3339(dt)
+    
+    raise ValueError(f"Unsupported time format: {time_str}. Expected ISO format, Unix timestamp, relative time (e.g., '5m', '1h'), or 'now'")
+
 
 class TimeConverter:
     """Utility class for converting various time formats to Loki-compatible formats."""
@@ -36,88 +115,33 @@ class TimeConverter:
             
         # Handle "now" keyword
         if time_str.lower() == "now":
-            return datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+            return _rfc3339(datetime.now(timezone.utc))
         
         # Handle relative time formats (e.g., "5m", "1h", "2d", "now-1h")
-        relative_match = re.match(r'^(\d+)([smhdw])$', time_str)
-        now_relative_match = re.match(r'^now-(\d+)([smhdw])$', time_str)
-        
-        if relative_match or now_relative_match:
-            if relative_match:
-                amount = int(relative_match.group(1))
-                unit = relative_match.group(2)
-            else:  # now_relative_match
-                amount = int(now_relative_match.group(1))
-                unit = now_relative_match.group(2)
-            
-            # Calculate the datetime
-            now = datetime.now(timezone.utc)
-            
-            if unit == 's':
-                target_time = now - timedelta(seconds=amount)
-            elif unit == 'm':
-                target_time = now - timedelta(minutes=amount)
-            elif unit == 'h':
-                target_time = now - timedelta(hours=amount)
-            elif unit == 'd':
-                target_time = now - timedelta(days=amount)
-            elif unit == 'w':
-                target_time = now - timedelta(weeks=amount)
-            else:
-                raise ValueError(f"Unsupported time unit: {unit}")
-            
-            return target_time.isoformat().replace('+00:00', 'Z')
+        relative_match = _REL_RE.match(time_str)
         
-        # Handle Unix timestamp (seconds or milliseconds)
-        if time_str.isdigit():
-            timestamp = int(time_str)
+        if relative_match:
+            amount = int(relative_match.group(1))
+            unit = relative_match.group(2)
             
-            # Detect if it's milliseconds (rough heuristic: > year 2020 in seconds)
-            if timestamp > 1577836800000:  # 2020-01-01 in milliseconds
-                timestamp = timestamp / 1000
+            try:
+                unit_seconds = _UNIT_SECONDS[unit]
+            except KeyError:
+                raise ValueError(f"Unsupported time unit: {unit}")
             
-            # Validate timestamp range (year 2000 to 2100)
-            if not (946684800 <= timestamp <= 4102444800):
-                raise ValueError(f"Timestamp out of reasonable range: {timestamp}")
+            # Calculate the datetime from the epoch clock
+            try:
+                target_time = datetime.fromtimestamp(
+                    _compute_relative(amount, unit_seconds, time.time()), tz=timezone.utc
+                )
+            except (OverflowError, OSError, ValueError):
+                # Outside the platform's timestamp range; use datetime arithmetic
+                target_time = datetime.now(timezone.utc) - timedelta(seconds=amount * unit_seconds)
             
-            dt = datetime.fromtimestamp(timestamp, tz=timezone.utc)
-            return dt.isoformat().replace('+00:00', 'Z')
-        
-        # Handle ISO format patterns
-        iso_patterns = [
-            r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?Z?$',
-            r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?[+-]\d{2}:\d{2}$',
-            r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$'
-        ]
-        
-        for pattern in iso_patterns:
-            if re.match(pattern, time_str):
-                try:
-                    # Try to parse the datetime to validate it
-                    if 'T' in time_str:
-                        if time_str.endswith('Z'):
-                            dt = datetime.fromisoformat(time_str.replace('Z', '+00:00'))
-                        elif '+' in time_str or time_str.count('-') > 2:
-                            dt = datetime.fromisoformat(time_str)
-                        else:
-                            # Assume UTC if no timezone info
-                            dt = datetime.fromisoformat(time_str).replace(tzinfo=timezone.utc)
-                    else:
-                        # Space-separated format, assume UTC
-                        dt = datetime.strptime(time_str, '%Y-%m-%d %H:%M:%S').replace(tzinfo=timezone.utc)
-                    
-                    # Convert to UTC and return in RFC3339 format
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=timezone.utc)
-                    else:
-                        dt = dt.astimezone(timezone.utc)
-                    
-                    return dt.isoformat().replace('+00:00', 'Z')
-                    
-                except ValueError as e:
-                    raise ValueError(f"Invalid datetime format: {time_str} - {e}")
-        
-        raise ValueError(f"Unsupported time format: {time_str}. Expected ISO format, Unix timestamp, relative time (e.g., '5m', '1h'), or 'now'")    
+            return _rfc3339(target_time)
+        
+        # Handle Unix timestamps and ISO format
+        return _absolute_to_loki_time(time_str)    
     
     @staticmethod
     def get_default_time_range() -> tuple[str, str]:
@@ -131,8 +155,8 @@ class TimeConverter:
         one_hour_ago = now - timedelta(hours=1)
         
         return (
-            one_hour_ago.isoformat().replace('+00:00', 'Z'),
-            now.isoformat().replace('+00:00', 'Z')
+            _rfc3339(one_hour_ago),
+            _rfc3339(now)
         )
     
     @staticmethod
@@ -154,22 +178,26 @@ class TimeConverter:
         start_converted = TimeConverter.to_loki_time(start) if start else None
         end_converted = TimeConverter.to_loki_time(end) if end else None
         
-        # Provide defaults if needed
+        # Provide defaults if needed, reading the clock at most once
         if start_converted is None and end_converted is None:
-            return TimeConverter.get_default_time_range()
-        elif start_converted is None:
-            # Default to 1 hour before end time
+            now = datetime.now(timezone.utc)
+            return _rfc3339(now - timedelta(hours=1)), _rfc3339(now)
+        
+        if end_converted is None:
+            # Default to now
+            end_dt = datetime.now(timezone.utc)
+            end_converted = _rfc3339(end_dt)
+        else:
             end_dt = datetime.fromisoformat(end_converted.replace('Z', '+00:00'))
+        
+        if start_converted is None:
+            # Default to 1 hour before end time
             start_dt = end_dt - timedelta(hours=1)
-            start_converted = start_dt.isoformat().replace('+00:00', 'Z')
-        elif end_converted is None:
-            # Default to now
-            end_converted = datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+            start_converted = _rfc3339(start_dt)
+        else:
+            start_dt = datetime.fromisoformat(start_converted.replace('Z', '+00:00'))
         
         # Validate that start is before end
-        start_dt = datetime.fromisoformat(start_converted.replace('Z', '+00:00'))
-        end_dt = datetime.fromisoformat(end_converted.replace('Z', '+00:00'))
-        
         if start_dt > end_dt:
             raise ValueError(f"Start time ({start_converted}) must be before or equal to end time ({end_converted})")
         
@@ -3,6 +3,7 @@
 from .query_logs import query_logs_tool, create_query_logs_tool, QueryLogsParams, QueryLogsResult
 from .search_logs import search_logs_tool, create_search_logs_tool, SearchLogsParams, SearchLogsResult
 from .get_labels import get_labels_tool, create_get_labels_tool, GetLabelsParams, GetLabelsResult
+from .batch_execute import create_batch_execute_tool, BatchExecuteParams, BatchExecuteResult, BatchOperation
 
 __all__ = [
     # Query logs tool
@@ -22,4 +23,10 @@ __all__ = [
     "create_get_labels_tool",
     "GetLabelsParams",
     "GetLabelsResult",
+    
+    # Batch execute tool
+    "create_batch_execute_tool",
+    "BatchExecuteParams",
+    "BatchExecuteResult",
+    "BatchOperation",
 ]
\ No newline at end of file
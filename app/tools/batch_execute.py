@@ -0,0 +1,96 @@
+"""Batch tool for running several Loki tool calls in one request."""
+
+from typing import Any, Dict, List, Optional
+
+from mcp import Tool
+from pydantic import BaseModel, Field
+
+
+class BatchOperation(BaseModel):
+    """A single tool call within a batch."""
+    
+    name: str = Field(
+        description="Name of the tool to call (query_logs, search_logs or get_labels)",
+        min_length=1
+    )
+    arguments: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Arguments for the tool call"
+    )
+
+
+class BatchExecuteParams(BaseModel):
+    """Parameters for the batch_execute tool."""
+    
+    operations: List[BatchOperation] = Field(
+        description="Tool calls to execute",
+        min_length=1,
+        max_length=50
+    )
+    max_concurrent: int = Field(
+        default=8,
+        description="Maximum number of tool calls to run at the same time",
+        ge=1,
+        le=32
+    )
+    stop_on_error: bool = Field(
+        default=False,
+        description="Cancel the remaining tool calls after the first failure"
+    )
+
+
+class BatchExecuteResult(BaseModel):
+    """Result from batch_execute tool."""
+    
+    status: str
+    operations: List[Dict[str, Any]]
+    total_operations: int
+    failed: int
+    error: Optional[str] = None
+
+
+def create_batch_execute_tool() -> Tool:
+    """Create the MCP tool definition for batch_execute."""
+    return Tool(
+        name="batch_execute",
+        description="Execute several query_logs, search_logs or get_labels calls concurrently in one request",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "operations": {
+                    "type": "array",
+                    "description": "Tool calls to execute",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "name": {
+                                "type": "string",
+                                "description": "Name of the tool to call",
+                                "enum": ["query_logs", "search_logs", "get_labels"]
+                            },
+                            "arguments": {
+                                "type": "object",
+                                "description": "Arguments for the tool call"
+                            }
+                        },
+                        "required": ["name"]
+                    },
+                    "minItems": 1,
+                    "maxItems": 50
+                },
+                "max_concurrent": {
+                    "type": "integer",
+                    "description": "Maximum number of tool calls to run at the same time",
+                    "minimum": 1,
+                    "maximum": 32,
+                    "default": 8
+                },
+                "stop_on_error": {
+                    "type": "boolean",
+                    "description": "Cancel the remaining tool calls after the first failure",
+                    "default": False
+                }
+            },
+            "required": ["operations"]
+        }
+    )
\ No newline at end of file
@@ -9,7 +9,7 @@ from mcp import Tool
 from pydantic import BaseModel, Field
 
 from ..enhanced_client import EnhancedLokiClient
-from ..loki_client import LokiClientError
+from ..loki_client import LokiClient, LokiClientError
 from ..config import LokiConfig
 from ..time_utils import convert_time
 
@@ -94,7 +94,8 @@ def clear_label_cache() -> None:
 
 async def get_labels_tool(
     params: GetLabelsParams,
-    config: LokiConfig
+    config: LokiConfig,
+    loki_client: Optional[LokiClient] = None
 ) -> GetLabelsResult:
     """
     Retrieve available log labels or label values from Loki.
@@ -130,7 +131,7 @@ async def get_labels_tool(
             )
     
     try:
-        async with EnhancedLokiClient(config) as client:
+        async with EnhancedLokiClient(config, client=loki_client) as client:
             # Convert time parameters to proper format
             start_time = convert_time(params.start)
             end_time = convert_time(params.end)
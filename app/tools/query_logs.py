@@ -8,7 +8,7 @@ from mcp import Tool
 from pydantic import BaseModel, Field, field_validator
 
 from ..enhanced_client import EnhancedLokiClient
-from ..loki_client import LokiClientError
+from ..loki_client import LokiClient, LokiClientError
 from ..config import LokiConfig
 from ..time_utils import get_time_range
 
@@ -63,7 +63,8 @@ class QueryLogsResult(BaseModel):
 
 async def query_logs_tool(
     params: QueryLogsParams,
-    config: LokiConfig
+    config: LokiConfig,
+    loki_client: Optional[LokiClient] = None
 ) -> QueryLogsResult:
     """
     Execute a LogQL query against Loki and return formatted results.
@@ -78,7 +79,7 @@ async def query_logs_tool(
     logger.info("Executing LogQL query", query=params.query)
     
     try:
-        async with EnhancedLokiClient(config) as client:
+        async with EnhancedLokiClient(config, client=loki_client) as client:
             # Always use range queries with proper time conversion
             start_time, end_time = get_time_range(params.start, params.end)
             
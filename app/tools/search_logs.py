@@ -8,7 +8,7 @@ from mcp import Tool
 from pydantic import BaseModel, Field, field_validator
 
 from ..enhanced_client import EnhancedLokiClient
-from ..loki_client import LokiClientError
+from ..loki_client import LokiClient, LokiClientError
 from ..config import LokiConfig
 from ..query_builder import LogQLQueryBuilder
 from ..time_utils import get_time_range
@@ -84,7 +84,8 @@ class SearchLogsResult(BaseModel):
 
 async def search_logs_tool(
     params: SearchLogsParams,
-    config: LokiConfig
+    config: LokiConfig,
+    loki_client: Optional[LokiClient] = None
 ) -> SearchLogsResult:
     """
     Search logs using keywords and return formatted results.
@@ -117,7 +118,7 @@ async def search_logs_tool(
             # and merge results (this is a limitation of LogQL)
             all_entries = []
             
-            async with EnhancedLokiClient(config) as client:
+            async with EnhancedLokiClient(config, client=loki_client) as client:
                 for query in queries:
                     try:
                         if params.start or params.end:
@@ -160,7 +161,7 @@ async def search_logs_tool(
                 case_sensitive=params.case_sensitive
             )
             
-            async with EnhancedLokiClient(config) as client:
+            async with EnhancedLokiClient(config, client=loki_client) as client:
                 if params.start or params.end:
                     start_time, end_time = get_time_range(params.start, params.end)
                     
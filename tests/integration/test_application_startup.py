@@ -57,7 +57,43 @@ class TestApplicationStartup:
             result = await validate_startup(config)
             
             assert result is False
+    
+    @pytest.mark.asyncio
+    async def test_validate_startup_shared_client(self):
+        """Test that a shared client is used and left open for the server."""
+        config = LokiConfig(url="http://localhost:3100")
+        client = AsyncMock()
+        client.label_names.return_value = ["job"]
+        
+        with patch('app.loki_client.LokiClient') as mock_client_class:
+            result = await validate_startup(config, client=client)
+            
+            assert result is True
+            mock_client_class.assert_not_called()
+            client.label_names.assert_called_once()
+            client.close.assert_not_called()
 
+    
+    @pytest.mark.asyncio
+    async def test_main_closes_client_on_startup_failure(self):
+        """Test that the shared client is closed when startup validation fails."""
+        import argparse
+        from app.main import main
+        
+        args = argparse.Namespace(transport="stdio", validate_only=False, log_level="INFO")
+        client = AsyncMock()
+        
+        with patch.dict(os.environ), \
+                patch('app.main.setup_default_logging'), \
+                patch('app.config.load_config', return_value=LokiConfig(url="http://localhost:3100")), \
+                patch('app.loki_client.LokiClient', return_value=client), \
+                patch('app.server.create_server', new=AsyncMock()), \
+                patch('app.main.validate_startup', new=AsyncMock(return_value=False)):
+            with pytest.raises(SystemExit) as exc_info:
+                await main(args)
+        
+        assert exc_info.value.code == 1
+        client.close.assert_awaited_once()
 
 class TestCLIArgumentParsing:
     """Test command-line argument parsing."""
@@ -133,6 +169,24 @@ class TestGracefulShutdown:
         # Should timeout since no signal is sent
         with pytest.raises(asyncio.TimeoutError):
             await asyncio.wait_for(shutdown.wait_for_shutdown(), timeout=0.1)
+    
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(sys.platform == "win32", reason="loop signal handlers are Unix-only")
+    async def test_graceful_shutdown_loop_signal_handler(self):
+        """Test that signals are delivered through the running event loop."""
+        loop = asyncio.get_running_loop()
+        shutdown = GracefulShutdown(loop)
+        
+        try:
+            with patch('app.main.logger') as mock_logger:
+                os.kill(os.getpid(), signal.SIGTERM)
+                await asyncio.wait_for(shutdown.wait_for_shutdown(), timeout=1.0)
+            
+            assert shutdown.shutdown_event.is_set()
+            mock_logger.info.assert_called_once_with("Shutdown signal received", signal=signal.SIGTERM)
+        finally:
+            loop.remove_signal_handler(signal.SIGTERM)
+            loop.remove_signal_handler(signal.SIGINT)
 
 
 class TestCLIIntegration:
@@ -355,8 +355,8 @@ class TestComprehensiveScenarios:
             
             def intermittent_failure(*args, **kwargs):
                 # Extract query from kwargs or args
-                if 'params' in kwargs and 'query' in kwargs['params']:
-                    query = kwargs['params']['query']
+                if 'params' in kwargs and 'query' in dict(kwargs['params']):
+                    query = dict(kwargs['params'])['query']
                 elif args and len(args) > 1:
                     query = args[1].get('query', '') if isinstance(args[1], dict) else ''
                 else:
@@ -3,7 +3,7 @@
 import asyncio
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
-import requests
+import httpx
 
 from app.config import LokiConfig
 from app.loki_client import LokiClient, LokiConnectionError, LokiAuthenticationError, LokiRateLimitError, LokiQueryError
@@ -53,7 +53,7 @@ class TestLokiClientErrorScenarios:
         # Initialize the session
         await client._ensure_session()
         
-        with patch.object(client._session, 'request', side_effect=requests.exceptions.Timeout("Connection timed out")):
+        with patch.object(client._session, 'request', side_effect=httpx.ReadTimeout("Connection timed out")):
             with pytest.raises(LokiConnectionError) as exc_info:
                 await client.query_instant("up")
             
@@ -66,7 +66,7 @@ class TestLokiClientErrorScenarios:
         # Initialize the session
         await client._ensure_session()
         
-        with patch.object(client._session, 'request', side_effect=requests.exceptions.ConnectionError("Connection refused")):
+        with patch.object(client._session, 'request', side_effect=httpx.ConnectError("Connection refused")):
             with pytest.raises(LokiConnectionError) as exc_info:
                 await client.query_instant("up")
             
@@ -84,7 +84,9 @@ class TestLokiClientErrorScenarios:
         mock_response.status_code = 401
         mock_response.text = "Unauthorized"
         mock_response.json.return_value = {"error": "Unauthorized"}
-        mock_response.raise_for_status.side_effect = requests.exceptions.HTTPError("401 Client Error: Unauthorized")
+        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            "401 Client Error: Unauthorized", request=Mock(), response=mock_response
+        )
         
         with patch.object(client._session, 'request', return_value=mock_response):
             with pytest.raises(LokiAuthenticationError) as exc_info:
@@ -126,9 +128,7 @@ class TestLokiClientErrorScenarios:
                     return mock_response
                 else:
                     # Third call succeeds
-                    mock_response = Mock()
-                    mock_response.status_code = 200
-                    mock_response.json.return_value = {"data": {"result": []}}
+                    mock_response = httpx.Response(200, json={"data": {"result": []}})
                     return mock_response
             
             with patch.object(client._session, 'request', side_effect=mock_request):
@@ -145,7 +145,7 @@ class TestLokiClientErrorScenarios:
         """Test circuit breaker activation after multiple failures."""
         async with LokiClient(test_config) as client:
             # Mock consistent failures
-            with patch.object(client._session, 'request', side_effect=requests.exceptions.ConnectionError("Connection refused")):
+            with patch.object(client._session, 'request', side_effect=httpx.ConnectError("Connection refused")):
                 with patch('asyncio.sleep', return_value=None):
                     # Make multiple failing requests to trigger circuit breaker
                     for _ in range(6):  # More than failure threshold
@@ -164,15 +164,13 @@ class TestLokiClientErrorScenarios:
         """Test that error statistics are properly tracked."""
         async with LokiClient(test_config) as client:
             # Successful request
-            mock_response = Mock()
-            mock_response.status_code = 200
-            mock_response.json.return_value = {"data": {"result": []}}
+            mock_response = httpx.Response(200, json={"data": {"result": []}})
             
             with patch.object(client._session, 'request', return_value=mock_response):
                 await client.query_instant("up")
             
             # Failed request
-            with patch.object(client._session, 'request', side_effect=requests.exceptions.Timeout("Timeout")):
+            with patch.object(client._session, 'request', side_effect=httpx.ReadTimeout("Timeout")):
                 with pytest.raises(LokiConnectionError):
                     await client.query_instant("up")
             
@@ -335,6 +333,31 @@ class TestMCPServerErrorHandling:
         assert ("parameter" in result.root.content[0].text.lower() or 
                 "validation" in result.root.content[0].text.lower())
     
+    @pytest.mark.asyncio
+    async def test_validation_error_lists_failing_fields(self, mcp_server):
+        """Test that validation errors name the failing fields."""
+        from mcp import types
+        from pydantic import ValidationError
+        
+        try:
+            QueryLogsParams(query="{job=\"test\"}", limit=0)
+        except ValidationError as e:
+            validation_error = e
+        
+        call_tool_handler = mcp_server.server.request_handlers[types.CallToolRequest]
+        request = types.CallToolRequest(
+            method="tools/call",
+            params=types.CallToolRequestParams(name="query_logs", arguments={"query": "{job=\"test\"}"})
+        )
+        
+        with patch.object(mcp_server, '_dispatch', {"query_logs": AsyncMock(side_effect=validation_error)}):
+            result = await call_tool_handler(request)
+        
+        text = result.root.content[0].text
+        assert "Parameter validation failed" in text
+        assert "limit: " in text
+        assert "Please check the parameters: ['query']" in text
+    
     @pytest.mark.asyncio
     async def test_connection_error_formatting(self, mcp_server):
         """Test formatting of connection errors."""
@@ -440,12 +463,10 @@ class TestErrorRecoveryScenarios:
                 call_count += 1
                 if call_count <= 2:
                     # First two calls fail with network error
-                    raise requests.exceptions.ConnectionError("Network unreachable")
+                    raise httpx.ConnectError("Network unreachable")
                 else:
                     # Subsequent calls succeed
-                    mock_response = Mock()
-                    mock_response.status_code = 200
-                    mock_response.json.return_value = {"data": {"result": []}}
+                    mock_response = httpx.Response(200, json={"data": {"result": []}})
                     return mock_response
             
             with patch.object(client._session, 'request', side_effect=mock_request):
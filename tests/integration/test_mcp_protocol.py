@@ -42,6 +42,35 @@ class TestMCPProtocolCompliance:
         assert server.server is not None
         assert server.server.name == "loki-mcp-server"
     
+    @pytest.mark.asyncio
+    async def test_server_owns_shared_client(self, mock_config: LokiConfig):
+        """Test that a server without a client creates one for all calls and closes it."""
+        from app.loki_client import LokiClient
+        
+        server = LokiMCPServer(mock_config)
+        assert isinstance(server.client, LokiClient)
+        
+        with patch.object(LokiClient, 'label_names', new=AsyncMock(return_value=["job"])), \
+                patch.object(LokiClient, 'close', new=AsyncMock()) as mock_close:
+            await server._handle_get_labels({"use_cache": False})
+            await server._handle_get_labels({"use_cache": False})
+            mock_close.assert_not_called()
+            
+            await server.close()
+            mock_close.assert_awaited_once()
+        
+        shared = AsyncMock()
+        await LokiMCPServer(mock_config, client=shared).close()
+        shared.close.assert_not_called()
+    
+    def test_server_freezes_startup_objects(self, mock_config: LokiConfig):
+        """Test that objects alive at startup are moved out of the collector's view."""
+        import gc
+        
+        with patch.object(gc, 'freeze') as mock_freeze:
+            LokiMCPServer(mock_config)
+        mock_freeze.assert_called_once_with()
+    
     @pytest.mark.asyncio
     async def test_list_tools_functionality(self, server: LokiMCPServer):
         """Test that tools can be listed through the server."""
@@ -217,6 +246,104 @@ class TestMCPProtocolCompliance:
         except ValidationError:
             pass  # Expected
     
+    @pytest.mark.asyncio
+    @patch('app.tools.get_labels.EnhancedLokiClient')
+    async def test_trusted_arguments_skip_validation(self, mock_client_class, mock_config: LokiConfig):
+        """Test that trust_arguments skips validation only for flat, well-typed arguments."""
+        from dataclasses import replace
+        from pydantic import ValidationError
+        from app.tools.get_labels import GetLabelsParams
+        
+        mock_client = AsyncMock()
+        mock_client_class.return_value.__aenter__.return_value = mock_client
+        mock_client.label_names.return_value = ["job", "level"]
+        
+        server = LokiMCPServer(replace(mock_config, trust_arguments=True))
+        
+        with patch.object(GetLabelsParams, 'model_construct', wraps=GetLabelsParams.model_construct) as mock_construct:
+            result = await server._handle_get_labels({"use_cache": False})
+            
+            assert mock_construct.called
+            assert result.status == "success"
+            assert result.labels == ["job", "level"]
+            
+            # Values that need coercion are still validated
+            mock_construct.reset_mock()
+            result = await server._handle_get_labels({"use_cache": "false"})
+            
+            assert not mock_construct.called
+            assert result.status == "success"
+        
+        # Models with constraints or validators are always validated
+        with pytest.raises(ValidationError):
+            await server._handle_query_logs({"query": "{job=\"test\"}", "limit": 10000})
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("trust_arguments", [False, True])
+    async def test_batch_execute_aggregates_results(self, mock_config: LokiConfig, trust_arguments: bool):
+        """Test that batch_execute runs each call and reports failures per call."""
+        from dataclasses import replace
+        from app.tools.get_labels import GetLabelsResult
+        
+        server = LokiMCPServer(replace(mock_config, trust_arguments=trust_arguments))
+        labels_result = GetLabelsResult(
+            status="success",
+            label_type="names",
+            label_name=None,
+            labels=["job", "level"],
+            total_count=2,
+            time_range={"start": None, "end": None},
+            cached=False
+        )
+        
+        with patch('app.server.get_labels_tool', new=AsyncMock(return_value=labels_result)) as mock_tool:
+            result = await server._handle_batch_execute({
+                "operations": [
+                    {"name": "get_labels", "arguments": {}},
+                    {"name": "get_labels", "arguments": {"label_name": "job"}},
+                    {"name": "batch_execute", "arguments": {}}
+                ]
+            })
+        
+        assert mock_tool.await_count == 2
+        assert result.status == "partial"
+        assert result.total_operations == 3
+        assert result.failed == 1
+        assert [op["status"] for op in result.operations] == ["success", "success", "error"]
+        assert "Unknown tool" in result.operations[2]["error"]
+        
+        formatted = server._format_tool_result(result)
+        assert "Executed 3 operations (1 failed)" in formatted
+        assert "job" in formatted
+    
+    @pytest.mark.asyncio
+    async def test_batch_execute_cancellation_cancels_operations(self, server: LokiMCPServer):
+        """Test that cancelling a stop_on_error batch cancels its running calls."""
+        started = asyncio.Event()
+        cancelled = []
+        
+        async def slow_get_labels(*args):
+            started.set()
+            try:
+                await asyncio.sleep(60)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+        
+        with patch('app.server.get_labels_tool', new=AsyncMock(side_effect=slow_get_labels)):
+            batch = asyncio.ensure_future(server._handle_batch_execute({
+                "operations": [{"name": "get_labels"}, {"name": "get_labels"}],
+                "stop_on_error": True
+            }))
+            await asyncio.wait_for(started.wait(), timeout=1.0)
+            batch.cancel()
+            
+            with pytest.raises(asyncio.CancelledError):
+                await batch
+            await asyncio.sleep(0)
+        
+        assert len(cancelled) == 2
+    
     @pytest.mark.asyncio
     @patch('app.tools.query_logs.EnhancedLokiClient')
     async def test_execution_error_handling(self, mock_client_class, server: LokiMCPServer):
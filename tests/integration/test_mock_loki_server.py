@@ -1,7 +1,9 @@
 """Integration tests with mock Loki server."""
 
 import asyncio
+from dataclasses import replace
 from unittest.mock import AsyncMock, Mock, patch
+import httpx
 import pytest
 
 from app.config import LokiConfig
@@ -60,12 +62,12 @@ class TestMockLokiServerIntegration:
                 mock_request.assert_called_once_with(
                     "GET",
                     "/loki/api/v1/query_range",
-                    params={
-                        "query": '{job="web-server"}',
-                        "start": "2024-01-01T00:00:00Z",
-                        "end": "2024-01-01T01:00:00Z",
-                        "direction": "backward"
-                    }
+                    params=[
+                        ("query", '{job="web-server"}'),
+                        ("start", "2024-01-01T00:00:00Z"),
+                        ("end", "2024-01-01T01:00:00Z"),
+                        ("direction", "backward")
+                    ]
                 )
     
     @pytest.mark.asyncio
@@ -93,11 +95,11 @@ class TestMockLokiServerIntegration:
                 mock_request.assert_called_once_with(
                     "GET",
                     "/loki/api/v1/query",
-                    params={
-                        "query": '{job="web-server"} |= "error"',
-                        "limit": 50,
-                        "direction": "backward"
-                    }
+                    params=[
+                        ("query", '{job="web-server"} |= "error"'),
+                        ("direction", "backward"),
+                        ("limit", 50)
+                    ]
                 )
     
     @pytest.mark.asyncio
@@ -120,7 +122,7 @@ class TestMockLokiServerIntegration:
                 mock_request.assert_called_once_with(
                     "GET",
                     "/loki/api/v1/labels",
-                    params={}
+                    params=[]
                 )
     
     @pytest.mark.asyncio
@@ -143,7 +145,7 @@ class TestMockLokiServerIntegration:
                 mock_request.assert_called_once_with(
                     "GET",
                     "/loki/api/v1/label/level/values",
-                    params={}
+                    params=[]
                 )
     
     @pytest.mark.asyncio
@@ -177,24 +179,19 @@ class TestMockLokiServerIntegration:
     @pytest.mark.asyncio
     async def test_retry_mechanism(self, config, mock_server):
         """Test that connection errors are properly raised (retry not implemented yet)."""
-        import requests
-        with patch('asyncio.to_thread', side_effect=requests.exceptions.ConnectionError("Temporary failure")) as mock_to_thread:
-            
-            async with LokiClient(config) as client:
+        async with LokiClient(config) as client:
+            with patch.object(client._session, 'request', side_effect=httpx.ConnectError("Temporary failure")):
                 with pytest.raises(LokiConnectionError, match="Temporary failure"):
                     await client.query_instant(query='{job="web-server"}')
     
     @pytest.mark.asyncio
     async def test_rate_limiting(self, config):
         """Test rate limiting functionality."""
-        config.rate_limit_requests = 2
-        config.rate_limit_period = 1
+        config = replace(config, rate_limit_requests=2, rate_limit_period=1)
         
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = SAMPLE_QUERY_INSTANT_RESPONSE
-        with patch('asyncio.to_thread', return_value=mock_response) as mock_to_thread:
-            async with LokiClient(config) as client:
+        mock_response = httpx.Response(200, json=SAMPLE_QUERY_INSTANT_RESPONSE)
+        async with LokiClient(config) as client:
+            with patch.object(client._session, 'request', return_value=mock_response) as mock_session_request:
                 start_time = asyncio.get_event_loop().time()
                 
                 await client.query_instant(query='{job="test1"}')
@@ -204,7 +201,7 @@ class TestMockLokiServerIntegration:
                 end_time = asyncio.get_event_loop().time()
                 
                 assert end_time - start_time >= 0.9
-                assert mock_to_thread.call_count == 3
+                assert mock_session_request.call_count == 3
     
     @pytest.mark.asyncio
     async def test_concurrent_requests(self, config, mock_server):
@@ -275,12 +272,10 @@ class TestMockLokiServerIntegration:
     @pytest.mark.asyncio
     async def test_timeout_handling(self, config):
         """Test timeout handling."""
-        config.timeout = 0.1
+        config = replace(config, timeout=0.1)
         
-        import requests
-        with patch('asyncio.to_thread', side_effect=requests.exceptions.Timeout("Request timed out")):
-            
-            async with LokiClient(config) as client:
+        async with LokiClient(config) as client:
+            with patch.object(client._session, 'request', side_effect=httpx.ReadTimeout("Request timed out")):
                 with pytest.raises(LokiConnectionError, match="timed out"):
                     await client.query_instant(query='{job="web-server"}')
     
@@ -2,6 +2,7 @@
 
 import asyncio
 import time
+from dataclasses import replace
 from unittest.mock import AsyncMock, patch
 import pytest
 
@@ -165,8 +166,7 @@ class TestQueryPerformance:
     async def test_rate_limiting_performance(self, config):
         """Test performance under rate limiting conditions."""
         # Set moderate rate limits
-        config.rate_limit_requests = 10
-        config.rate_limit_period = 1
+        config = replace(config, rate_limit_requests=10, rate_limit_period=1)
         
         with patch('app.loki_client.LokiClient._make_request') as mock_request:
             mock_request.return_value = SAMPLE_QUERY_INSTANT_RESPONSE
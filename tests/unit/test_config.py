@@ -1,6 +1,7 @@
 """Unit tests for configuration management."""
 
 import os
+from dataclasses import FrozenInstanceError
 import pytest
 from unittest.mock import patch
 
@@ -123,6 +124,13 @@ class TestLokiConfig:
         with pytest.raises(ConfigurationError, match="Rate limit period must be positive"):
             LokiConfig(url="http://localhost:3100", rate_limit_period=0)
 
+    def test_config_is_immutable(self):
+        """Test that config fields cannot be reassigned after construction."""
+        config = LokiConfig(url="http://localhost:3100")
+        
+        with pytest.raises(FrozenInstanceError):
+            config.timeout = 60
+
 
 class TestLoadConfig:
     """Test cases for load_config function."""
@@ -237,4 +245,32 @@ class TestLoadConfig:
         with patch.dict(os.environ, env_vars, clear=True):
             config = load_config()
             assert config.username == ''  # Empty string, not None
-            assert config.password == ''
\ No newline at end of file
+            assert config.password == ''
+
+    def test_load_config_returns_cached_instance(self):
+        """Test that repeated loads with an unchanged environment reuse the config."""
+        with patch.dict(os.environ, {'LOKI_URL': 'http://localhost:3100'}, clear=True):
+            first = load_config()
+            second = load_config()
+            
+            assert first is second
+
+    def test_load_config_cache_follows_environment_changes(self):
+        """Test that changing an environment variable produces a fresh config."""
+        with patch.dict(os.environ, {'LOKI_URL': 'http://localhost:3100'}, clear=True):
+            first = load_config()
+        
+        with patch.dict(os.environ, {'LOKI_URL': 'http://loki:3100'}, clear=True):
+            second = load_config()
+        
+        assert first is not second
+        assert second.url == "http://loki:3100"
+
+    def test_load_config_reset_cache(self):
+        """Test that reset_cache forces the configuration to be rebuilt."""
+        with patch.dict(os.environ, {'LOKI_URL': 'http://localhost:3100'}, clear=True):
+            first = load_config()
+            second = load_config(reset_cache=True)
+            
+            assert first is not second
+            assert first == second
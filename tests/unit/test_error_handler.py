@@ -7,6 +7,7 @@ import pytest
 import httpx
 
 from app.error_handler import (
+    DIRECT_FALLBACK,
     ErrorCategory,
     ErrorSeverity,
     ErrorContext,
@@ -91,7 +92,8 @@ class TestErrorClassifier:
         # Mock response for 401
         response_401 = Mock()
         response_401.status_code = 401
-        response_401.text = "Unauthorized"
+        response_401.content = b"Unauthorized"
+        response_401.encoding = "utf-8"
         error_401 = httpx.HTTPStatusError("401", request=Mock(), response=response_401)
         
         error_info = ErrorClassifier.classify_error(error_401)
@@ -101,7 +103,8 @@ class TestErrorClassifier:
         # Mock response for 429
         response_429 = Mock()
         response_429.status_code = 429
-        response_429.text = "Too Many Requests"
+        response_429.content = b"Too Many Requests"
+        response_429.encoding = "utf-8"
         response_429.headers = {"retry-after": "30"}
         error_429 = httpx.HTTPStatusError("429", request=Mock(), response=response_429)
         
@@ -112,13 +115,26 @@ class TestErrorClassifier:
         # Mock response for 500
         response_500 = Mock()
         response_500.status_code = 500
-        response_500.text = "Internal Server Error"
+        response_500.content = b"Internal Server Error"
+        response_500.encoding = "utf-8"
         error_500 = httpx.HTTPStatusError("500", request=Mock(), response=response_500)
         
         error_info = ErrorClassifier.classify_error(error_500)
         assert error_info.category == ErrorCategory.CONNECTION
         assert error_info.should_retry
     
+    def test_classify_http_status_error_truncates_large_body(self):
+        """Test only the start of a large error response body is kept."""
+        request = httpx.Request("GET", "http://localhost:3100/loki/api/v1/query")
+        response = httpx.Response(500, content=b"x" * 10000, request=request)
+        error = httpx.HTTPStatusError("500", request=request, response=response)
+        
+        error_info = ErrorClassifier.classify_error(error)
+        
+        assert error_info.details.startswith("HTTP 500: xxx")
+        assert error_info.details.endswith("...")
+        assert len(error_info.details) < 600
+    
     def test_classify_validation_error(self):
         """Test classification of validation errors."""
         # Mock a validation error
@@ -140,6 +156,26 @@ class TestErrorClassifier:
         assert error_info.severity == ErrorSeverity.MEDIUM
         assert "Unexpected error" in error_info.message
         assert error_info.should_retry
+    
+    def test_classify_error_fast_matches_full_classification(self):
+        """Test the retry-only classification agrees with classify_error."""
+        errors = [
+            LokiAuthenticationError("Invalid credentials"),
+            LokiRateLimitError("Too many requests"),
+            LokiQueryError("Invalid LogQL syntax"),
+            LokiConnectionError("Connection refused"),
+            httpx.ReadTimeout("Read timed out"),
+            ValueError("Some unexpected error"),
+        ]
+        
+        for error in errors:
+            error_info = ErrorClassifier.classify_error(error)
+            assert ErrorClassifier.classify_error_fast(error) == (
+                error_info.category,
+                error_info.message,
+                error_info.should_retry,
+                error_info.retry_after
+            )
 
 
 class TestBackoffStrategy:
@@ -169,6 +205,14 @@ class TestBackoffStrategy:
         assert 1.5 <= delay_jitter_1 <= 2.5  # 2.0 ± 25%
         assert 1.5 <= delay_jitter_2 <= 2.5
     
+    def test_exponential_backoff_beyond_precomputed_attempts(self):
+        """Test delays past the precomputed table still follow the formula."""
+        for attempt in (0, 5, 9, 10, 15):
+            delay = BackoffStrategy.exponential_backoff(
+                attempt, base_delay=0.01, max_delay=1000.0, jitter=False
+            )
+            assert delay == min(0.01 * (2 ** attempt), 1000.0)
+    
     def test_linear_backoff(self):
         """Test linear backoff calculation."""
         delay_0 = BackoffStrategy.linear_backoff(0, base_delay=2.0)
@@ -276,9 +320,12 @@ class TestCircuitBreaker:
         assert status["failure_count"] == 0
         assert status["can_execute"] is True
         
+        before = time.time()
         cb.record_failure()
         status = cb.get_status()
         assert status["failure_count"] == 1
+        # Reported as wall-clock time, not the monotonic recovery clock
+        assert before <= status["last_failure_time"] <= time.time()
 
 
 class TestErrorStatistics:
@@ -326,6 +373,21 @@ class TestErrorStatistics:
         
         assert statistics["total_operations"] == 2
         assert statistics["total_errors"] == 1
+    
+    def test_error_counts_view_and_snapshot(self):
+        """Test error counts are a live read-only view unless snapshotted."""
+        stats = ErrorStatistics()
+        stats.record_error("query_logs", ErrorCategory.CONNECTION)
+        
+        view = stats.get_statistics()["error_counts_by_category"]
+        snapshot = stats.snapshot()["error_counts_by_category"]
+        
+        stats.record_error("query_logs", ErrorCategory.CONNECTION)
+        
+        assert view["connection"] == 2
+        assert snapshot["connection"] == 1
+        with pytest.raises(TypeError):
+            view["connection"] = 0
 
 
 class TestErrorHandler:
@@ -446,6 +508,115 @@ class TestErrorHandler:
         
         assert "Circuit breaker is open" in str(exc_info.value)
     
+    @pytest.mark.asyncio
+    async def test_handle_once_success(self, error_handler, error_context):
+        """Test single-attempt execution records success."""
+        async def successful_operation():
+            return {"result": "success"}
+        
+        result = await error_handler.handle_once(successful_operation, error_context)
+        
+        assert result == {"result": "success"}
+        stats = error_handler.get_error_statistics()
+        assert stats["operation_stats"]["test_operation"]["success_count"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_handle_once_does_not_retry(self, error_handler, error_context):
+        """Test single-attempt execution raises enhanced error without retrying."""
+        call_count = 0
+        
+        async def failing_operation():
+            nonlocal call_count
+            call_count += 1
+            raise LokiConnectionError("Connection failed")
+        
+        with pytest.raises(LokiConnectionError, match="Failed to connect to Loki"):
+            await error_handler.handle_once(failing_operation, error_context)
+        
+        assert call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_try_direct_success(self, error_handler):
+        """Test direct execution returns the result and records success."""
+        async def successful_operation(value):
+            return {"result": value}
+        
+        result = await error_handler.try_direct(successful_operation, "test_operation", "ok")
+        
+        assert result == {"result": "ok"}
+        stats = error_handler.get_error_statistics()
+        assert stats["operation_stats"]["test_operation"]["success_count"] == 1
+    
+    @pytest.mark.asyncio
+    async def test_try_direct_retries_after_first_failure(self, error_handler):
+        """Test a failed direct attempt counts as the first retry attempt."""
+        call_count = 0
+        
+        async def always_failing_operation():
+            nonlocal call_count
+            call_count += 1
+            raise LokiConnectionError("Connection failed")
+        
+        with patch('asyncio.sleep', new_callable=AsyncMock):
+            with pytest.raises(LokiConnectionError, match="Failed after 4 attempts"):
+                await error_handler.try_direct(always_failing_operation, "test_operation")
+        
+        assert call_count == 4  # max_retries + 1, no extra direct attempt
+    
+    @pytest.mark.asyncio
+    async def test_try_direct_falls_back_when_circuit_open(self):
+        """Test direct execution is skipped while the circuit breaker is open."""
+        error_handler = ErrorHandler(max_retries=0, enable_circuit_breaker=True)
+        error_handler.circuit_breaker.state = "open"
+        operation = AsyncMock()
+        
+        result = await error_handler.try_direct(operation, "test_operation")
+        
+        assert result is DIRECT_FALLBACK
+        operation.assert_not_called()
+    
+    def test_rate_limit_waits_are_coalesced(self, error_handler):
+        """Test concurrent rate-limited calls share one retry deadline."""
+        first = error_handler._handle_failure(
+            LokiRateLimitError("Rate limited"), ErrorContext(operation="test_operation"), 0
+        )
+        second = error_handler._handle_failure(
+            LokiRateLimitError("Rate limited"), ErrorContext(operation="test_operation"), 0
+        )
+        other = error_handler._handle_failure(
+            LokiRateLimitError("Rate limited"), ErrorContext(operation="other_operation"), 0
+        )
+        
+        assert first == 60
+        assert 59 < second <= 60
+        assert other == 60
+    
+    def test_rate_limit_waits_are_coalesced_across_clients(self):
+        """Test tool calls sharing a LokiClient share one retry deadline."""
+        from app.config import LokiConfig
+        from app.enhanced_client import EnhancedLokiClient
+        from app.loki_client import LokiClient
+        
+        config = LokiConfig(url="http://localhost:3100")
+        shared = LokiClient(config)
+        first_handler = EnhancedLokiClient(config, client=shared)._error_handler
+        second_handler = EnhancedLokiClient(config, client=shared)._error_handler
+        unshared_handler = EnhancedLokiClient(config)._error_handler
+        
+        first = first_handler._handle_failure(
+            LokiRateLimitError("Rate limited"), ErrorContext(operation="test_operation"), 0
+        )
+        second = second_handler._handle_failure(
+            LokiRateLimitError("Rate limited"), ErrorContext(operation="test_operation"), 0
+        )
+        unshared = unshared_handler._handle_failure(
+            LokiRateLimitError("Rate limited"), ErrorContext(operation="test_operation"), 0
+        )
+        
+        assert first == 60
+        assert 59 < second <= 60
+        assert unshared == 60
+    
     def test_get_error_statistics(self, error_handler):
         """Test error statistics retrieval."""
         stats = error_handler.get_error_statistics()
@@ -1,6 +1,7 @@
 """Unit tests for Loki HTTP client."""
 
 import asyncio
+import base64
 import json
 import time
 from unittest.mock import AsyncMock, Mock, patch
@@ -100,9 +101,14 @@ class TestLokiClient:
         
         assert client._session is not None
         assert client._session.auth is not None
-        # Should be a tuple for basic auth
-        assert isinstance(client._session.auth, tuple)
-        assert client._session.auth == (auth_config.username, auth_config.password)
+        assert isinstance(client._session.auth, httpx.BasicAuth)
+        
+        request = client._session.build_request("GET", "http://localhost:3100/test")
+        authed = next(client._session.auth.sync_auth_flow(request))
+        expected = base64.b64encode(
+            f"{auth_config.username}:{auth_config.password}".encode()
+        ).decode()
+        assert authed.headers["Authorization"] == f"Basic {expected}"
         
         await client.close()
 
@@ -118,72 +124,135 @@ class TestLokiClient:
         
         await client.close()
 
+    def test_session_per_event_loop(self, basic_config):
+        """Test each event loop gets its own session, reused within the loop."""
+        client = LokiClient(basic_config)
+        loops = [asyncio.new_event_loop(), asyncio.new_event_loop()]
+        try:
+            first = loops[0].run_until_complete(client._ensure_session())
+            again = loops[0].run_until_complete(client._ensure_session())
+            other = loops[1].run_until_complete(client._ensure_session())
+            
+            assert first is again
+            assert other is not first
+            
+            loops[1].run_until_complete(client.close())
+            loops[0].run_until_complete(first.aclose())
+            assert client._session is None
+        finally:
+            for loop in loops:
+                loop.close()
+
+    def test_concurrency_semaphore_per_event_loop(self, basic_config):
+        """Test the *_many fan-out semaphore is created per event loop."""
+        client = LokiClient(basic_config)
+        loops = [asyncio.new_event_loop(), asyncio.new_event_loop()]
+        
+        async def get_semaphore():
+            return client._concurrency()
+        
+        try:
+            first = loops[0].run_until_complete(get_semaphore())
+            again = loops[0].run_until_complete(get_semaphore())
+            other = loops[1].run_until_complete(get_semaphore())
+            
+            assert first is again
+            assert other is not first
+        finally:
+            for loop in loops:
+                loop.close()
+
     @pytest.mark.asyncio
-    async def test_make_request_success(self, basic_config, mock_response):
+    async def test_make_request_success(self, basic_config, mock_response, httpx_mock):
         """Test successful HTTP request."""
-        with patch('requests.Session') as mock_session_class:
-            mock_session = Mock()
-            mock_session_class.return_value = mock_session
-            
-            mock_resp = Mock()
-            mock_resp.status_code = 200
-            mock_resp.json.return_value = mock_response
+        httpx_mock.add_response(
+            method="GET",
+            url="http://localhost:3100/test?param=value",
+            json=mock_response
+        )
+        
+        async with LokiClient(basic_config) as client:
+            result = await client._make_request("GET", "/test", {"param": "value"})
             
-            # Mock asyncio.to_thread to return the mock response directly
-            with patch('asyncio.to_thread', return_value=mock_resp):
-                client = LokiClient(basic_config)
-                result = await client._make_request("GET", "/test", {"param": "value"})
-                
-                assert result == mock_response
+            assert result == mock_response
 
     @pytest.mark.asyncio
-    async def test_make_request_authentication_error(self, basic_config):
+    async def test_make_request_authentication_error(self, basic_config, httpx_mock):
         """Test authentication error handling."""
-        with patch('requests.Session') as mock_session_class:
-            mock_session = Mock()
-            mock_session_class.return_value = mock_session
-            
-            mock_resp = Mock()
-            mock_resp.status_code = 401
-            mock_session.request.return_value = mock_resp
-            
-            client = LokiClient(basic_config)
-            
+        httpx_mock.add_response(status_code=401)
+        
+        async with LokiClient(basic_config) as client:
             with pytest.raises(LokiAuthenticationError, match="Authentication failed"):
                 await client._make_request("GET", "/test")
 
     @pytest.mark.asyncio
-    async def test_make_request_rate_limit_error(self, basic_config):
+    async def test_make_request_rate_limit_error(self, basic_config, httpx_mock):
         """Test rate limit error handling."""
-        with patch('requests.Session') as mock_session_class:
-            mock_session = Mock()
-            mock_session_class.return_value = mock_session
-            
-            mock_resp = Mock()
-            mock_resp.status_code = 429
-            mock_session.request.return_value = mock_resp
-            
-            client = LokiClient(basic_config)
-            
+        httpx_mock.add_response(status_code=429)
+        
+        async with LokiClient(basic_config) as client:
             with pytest.raises(LokiRateLimitError, match="Rate limit exceeded"):
                 await client._make_request("GET", "/test")
 
     @pytest.mark.asyncio
-    async def test_make_request_query_error(self, basic_config):
+    async def test_make_request_query_error(self, basic_config, httpx_mock):
         """Test query error handling."""
-        with patch('requests.Session') as mock_session_class:
-            mock_session = Mock()
-            mock_session_class.return_value = mock_session
-            
-            mock_resp = Mock()
-            mock_resp.status_code = 400
-            mock_resp.json.return_value = {"error": "Invalid query"}
-            mock_session.request.return_value = mock_resp
+        httpx_mock.add_response(status_code=400, json={"error": "Invalid query"})
+        
+        async with LokiClient(basic_config) as client:
+            with pytest.raises(LokiQueryError, match="Invalid query"):
+                await client._make_request("GET", "/test")
+
+    @pytest.mark.asyncio
+    async def test_make_request_follows_redirects(self, basic_config, mock_response, httpx_mock):
+        """Test redirects from a proxy in front of Loki are followed."""
+        httpx_mock.add_response(
+            url="http://localhost:3100/test",
+            status_code=302,
+            headers={"Location": "http://localhost:3100/loki/test"}
+        )
+        httpx_mock.add_response(url="http://localhost:3100/loki/test", json=mock_response)
+        
+        async with LokiClient(basic_config) as client:
+            result = await client._make_request("GET", "/test")
             
-            client = LokiClient(basic_config)
+            assert result == mock_response
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status_code", [204, 304])
+    async def test_make_request_unexpected_status(self, basic_config, httpx_mock, status_code):
+        """Test empty 2xx and unfollowed 3xx replies raise instead of returning None."""
+        httpx_mock.add_response(status_code=status_code)
+        
+        async with LokiClient(basic_config) as client:
+            with pytest.raises(LokiQueryError, match=f"Loki API error: {status_code}"):
+                await client.label_names()
             
-            with pytest.raises(LokiQueryError, match="Invalid query"):
+            assert client.get_error_statistics()["error_counts_by_category"] == {"query": 1}
+
+    @pytest.mark.asyncio
+    async def test_make_request_connection_error(self, basic_config, httpx_mock):
+        """Test transport errors are raised as connection errors."""
+        httpx_mock.add_exception(httpx.ConnectError("Connection refused"))
+        
+        async with LokiClient(basic_config) as client:
+            with pytest.raises(LokiConnectionError, match="Failed to connect"):
                 await client._make_request("GET", "/test")
+            
+            assert client.get_error_statistics()["error_counts_by_category"] == {"connection": 1}
+
+    @pytest.mark.asyncio
+    async def test_session_reuses_connection_pool(self, basic_config, httpx_mock):
+        """Test consecutive requests share one pooled client."""
+        httpx_mock.add_response(json={"status": "success", "data": []}, is_reusable=True)
+        
+        async with LokiClient(basic_config) as client:
+            session = client._session
+            await client.label_names()
+            await client.label_names()
+            
+            assert client._session is session
+            assert len(httpx_mock.get_requests()) == 2
 
 
     @pytest.mark.asyncio
@@ -205,13 +274,13 @@ class TestLokiClient:
             mock_request.assert_called_once_with(
                 "GET",
                 "/loki/api/v1/query_range",
-                params={
-                    "query": '{job="test"}',
-                    "start": "2022-01-01T00:00:00Z",
-                    "end": "2022-01-01T01:00:00Z",
-                    "limit": 100,
-                    "direction": "backward"
-                }
+                params=[
+                    ("query", '{job="test"}'),
+                    ("start", "2022-01-01T00:00:00Z"),
+                    ("end", "2022-01-01T01:00:00Z"),
+                    ("direction", "backward"),
+                    ("limit", 100)
+                ]
             )
 
     @pytest.mark.asyncio
@@ -231,12 +300,12 @@ class TestLokiClient:
             mock_request.assert_called_once_with(
                 "GET",
                 "/loki/api/v1/query",
-                params={
-                    "query": '{job="test"}',
-                    "time": "2022-01-01T00:00:00Z",
-                    "limit": 50,
-                    "direction": "backward"
-                }
+                params=[
+                    ("query", '{job="test"}'),
+                    ("direction", "backward"),
+                    ("time", "2022-01-01T00:00:00Z"),
+                    ("limit", 50)
+                ]
             )
 
     @pytest.mark.asyncio
@@ -257,10 +326,10 @@ class TestLokiClient:
             mock_request.assert_called_once_with(
                 "GET",
                 "/loki/api/v1/labels",
-                params={
-                    "start": "2022-01-01T00:00:00Z",
-                    "end": "2022-01-01T01:00:00Z"
-                }
+                params=[
+                    ("start", "2022-01-01T00:00:00Z"),
+                    ("end", "2022-01-01T01:00:00Z")
+                ]
             )
 
     @pytest.mark.asyncio
@@ -278,9 +347,36 @@ class TestLokiClient:
             mock_request.assert_called_once_with(
                 "GET",
                 "/loki/api/v1/label/level/values",
-                params={}
+                params=[]
             )
 
+    @pytest.mark.asyncio
+    async def test_label_values_quotes_label_name(self, basic_config):
+        """Test label names are percent-encoded in the endpoint path."""
+        with patch.object(LokiClient, '_make_request', new_callable=AsyncMock) as mock_request:
+            mock_request.return_value = {"data": []}
+            
+            client = LokiClient(basic_config)
+            await client.label_values("a/b c")
+            
+            mock_request.assert_called_once_with(
+                "GET",
+                "/loki/api/v1/label/a%2Fb%20c/values",
+                params=[]
+            )
+
+    @pytest.mark.asyncio
+    async def test_make_request_keeps_base_url_path(self, httpx_mock):
+        """Test endpoints are appended to a base URL with a path prefix."""
+        config = LokiConfig(url="http://localhost:3100/loki-proxy/")
+        httpx_mock.add_response(
+            url="http://localhost:3100/loki-proxy/loki/api/v1/labels",
+            json={"status": "success", "data": ["job"]}
+        )
+        
+        async with LokiClient(config) as client:
+            assert await client.label_names() == ["job"]
+
     @pytest.mark.asyncio
     async def test_series(self, basic_config):
         """Test series retrieval."""
@@ -301,7 +397,7 @@ class TestLokiClient:
             mock_request.assert_called_once_with(
                 "GET",
                 "/loki/api/v1/series",
-                params={"match[]": '{job="test"}'}
+                params=[("match[]", '{job="test"}')]
             )
 
     @pytest.mark.asyncio
@@ -318,9 +414,35 @@ class TestLokiClient:
             mock_request.assert_called_once_with(
                 "GET",
                 "/loki/api/v1/series",
-                params={"match[]": ['{job="test"}', '{level="error"}']}
+                params=[("match[]", '{job="test"}'), ("match[]", '{level="error"}')]
             )
 
+    @pytest.mark.asyncio
+    async def test_label_values_many(self, basic_config):
+        """Test label values retrieval for several labels at once."""
+        async def fake_request(method, endpoint, params=None):
+            label = endpoint.split("/")[-2]
+            return {"data": [f"{label}-value"]}
+        
+        with patch.object(LokiClient, '_make_request', side_effect=fake_request) as mock_request:
+            client = LokiClient(basic_config)
+            result = await client.label_values_many(["job", "level"])
+            
+            assert result == {"job": ["job-value"], "level": ["level-value"]}
+            assert mock_request.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_series_many_preserves_order(self, basic_config):
+        """Test series retrieval for several selectors returns results in order."""
+        async def fake_request(method, endpoint, params=None):
+            return {"data": [{"match": dict(params)["match[]"]}]}
+        
+        with patch.object(LokiClient, '_make_request', side_effect=fake_request):
+            client = LokiClient(basic_config)
+            result = await client.series_many(['{job="a"}', '{job="b"}'])
+            
+            assert result == [[{"match": '{job="a"}'}], [{"match": '{job="b"}'}]]
+
 
 class TestRateLimiter:
     """Test cases for RateLimiter."""
@@ -376,23 +498,22 @@ class TestRateLimiter:
         # Should wait approximately 0.5 seconds (remaining window time)
         assert 0.4 <= end_time - start_time <= 0.6
 
-    def test_rate_limiter_cleanup_old_requests(self):
+    @pytest.mark.asyncio
+    async def test_rate_limiter_cleanup_old_requests(self):
         """Test that rate limiter cleans up old requests."""
         limiter = RateLimiter(max_requests=5, time_window=1)
         
         # Add some old requests
-        old_time = time.time() - 2  # 2 seconds ago
-        limiter.requests = [old_time, old_time, old_time]
+        old_time = time.monotonic() - 2  # 2 seconds ago
+        limiter.requests.extend([old_time, old_time, old_time])
         
         # Current time requests
-        current_time = time.time()
+        current_time = time.monotonic()
         limiter.requests.extend([current_time, current_time])
         
-        # Simulate cleanup (this happens in acquire)
-        now = time.time()
-        limiter.requests = [req_time for req_time in limiter.requests 
-                           if now - req_time < limiter.time_window]
+        # Cleanup happens in acquire, which records one more request
+        await limiter.acquire()
         
         # Should only have current requests left
-        assert len(limiter.requests) == 2
+        assert len(limiter.requests) == 3
         assert all(req_time >= current_time for req_time in limiter.requests)
\ No newline at end of file
@@ -43,6 +43,12 @@ class TestLogQLQueryBuilder:
         expected = '{__name__=~".+"}|~ "(?i)error\\[123\\]"'
         assert query == expected
     
+    def test_build_search_query_escapes_like_re_escape(self):
+        """Test that plain keywords are escaped exactly as re.escape would."""
+        for keyword in ["user-login", "timeout 500", "snake_case", "a.b*c"]:
+            query = self.builder.build_search_query([keyword], case_sensitive=True)
+            assert query == '{__name__=~".+"}|~ "' + re.escape(keyword) + '"'
+    
     def test_build_search_query_empty_keywords(self):
         """Test that empty keywords list raises ValueError."""
         with pytest.raises(ValueError, match="At least one keyword must be provided"):
@@ -153,6 +159,31 @@ class TestLogQLQueryBuilder:
         """Test that invalid label values raise ValueError."""
         with pytest.raises(ValueError, match="Invalid label value"):
             self.builder._build_label_selector({"key": 123})
+    
+    def test_build_label_selector_strict_key_syntax(self):
+        """Test that strict mode rejects label keys that are not valid label names."""
+        strict_builder = LogQLQueryBuilder(strict=True)
+        
+        assert strict_builder._build_label_selector({"service_name": "api"}) == '{service_name="api"}'
+        with pytest.raises(ValueError, match="Invalid label key"):
+            strict_builder._build_label_selector({"service-name": "api"})
+        
+        # The default builder leaves label name syntax to Loki
+        assert self.builder._build_label_selector({"service-name": "api"}) == '{service-name="api"}'
+    
+    def test_build_label_selector_memoized_keeps_order(self):
+        """Test that repeated label sets reuse the cached selector in insertion order."""
+        first = self.builder._build_label_selector({"service": "api", "env": "prod"})
+        second = self.builder._build_label_selector({"service": "api", "env": "prod"})
+        reordered = self.builder._build_label_selector({"env": "prod", "service": "api"})
+        
+        assert first == second == '{service="api", env="prod"}'
+        assert reordered == '{env="prod", service="api"}'
+    
+    def test_build_label_selector_unhashable_value(self):
+        """Test that unhashable label values raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid label value"):
+            self.builder._build_label_selector({"key": ["a", "b"]})
 
 
 class TestTimeValidation:
@@ -210,6 +241,16 @@ class TestTimeValidation:
             "2023-13-01T00:00:00Z",  # Invalid month
             "not-a-time",
             "123abc",
+            # int() accepts these, but they are not Unix timestamps
+            "1_700_000_000",
+            "+1700000000",
+            "\u00b2",
+            # Layouts only newer Python versions' fromisoformat accepts
+            "2024-01-01",
+            "20240101T101010",
+            "2024-W01-1",
+            "2024-01-01T10",
+            "2024-01-01 10:00:00+05:00",
         ]
         for time_str in invalid_times:
             with pytest.raises(ValueError, match="Invalid time format"):
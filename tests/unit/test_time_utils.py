@@ -3,7 +3,7 @@
 import pytest
 from datetime import datetime, timezone, timedelta
 
-from app.time_utils import TimeConverter, get_time_range, convert_time
+from app.time_utils import TimeConverter, get_time_range, convert_time, _absolute_to_loki_time
 
 
 class TestTimeConverter:
@@ -136,6 +136,19 @@ class TestTimeConverter:
         result = TimeConverter.to_loki_time(datetime_str)
         assert result == "2024-08-17T13:00:00Z"
     
+    def test_to_loki_time_absolute_cached(self):
+        """Test that absolute time conversions are cached but relative ones are not."""
+        _absolute_to_loki_time.cache_clear()
+        
+        first = TimeConverter.to_loki_time("2024-08-17T13:00:00+02:00")
+        second = TimeConverter.to_loki_time("2024-08-17T13:00:00+02:00")
+        TimeConverter.to_loki_time("5m")
+        
+        assert first == second == "2024-08-17T11:00:00Z"
+        info = _absolute_to_loki_time.cache_info()
+        assert info.hits == 1
+        assert info.currsize == 1
+    
     def test_to_loki_time_invalid_relative_unit(self):
         """Test invalid relative time unit."""
         with pytest.raises(ValueError, match="Unsupported time format"):
@@ -151,6 +164,18 @@ class TestTimeConverter:
         with pytest.raises(ValueError, match="Unsupported time format"):
             TimeConverter.to_loki_time("invalid-time")
     
+    @pytest.mark.parametrize("time_str", [
+        "2024-01-01",
+        "20240101T101010",
+        "2024-W01-1",
+        "2024-01-01T10",
+        "2024-01-01 10:00:00+05:00",
+    ])
+    def test_to_loki_time_unsupported_iso_layouts(self, time_str):
+        """Test ISO layouts outside the supported set are rejected on every Python version."""
+        with pytest.raises(ValueError, match="Unsupported time format"):
+            TimeConverter.to_loki_time(time_str)
+    
     def test_to_loki_time_invalid_iso_date(self):
         """Test invalid ISO date components."""
         with pytest.raises(ValueError, match="Invalid datetime format"):
@@ -173,6 +173,7 @@ class MCPTestClient:
         if self.client:
             self.client = None
         if self.server:
+            await self.server.close()
             self.server = None
     
     async def list_tools(self) -> List[types.Tool]: